@@ -0,0 +1,24 @@
+"""Asset loading: cold (empty caches) and warm (cache hits)."""
+from asset_manager import asset_manager
+from common import make_game, measure
+from session import MENU_BACKGROUND, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def load_all(game):
+    asset_manager.get_image(asset_manager.image_path(MENU_BACKGROUND), (SCREEN_WIDTH, SCREEN_HEIGHT))
+    for ingredient in game.ingredients:
+        ingredient.load_image()
+
+
+def run():
+    game = make_game()
+    results = {}
+
+    def cold():
+        asset_manager.clear()
+        load_all(game)
+    results["assets.cold_load"] = measure(cold, number=1, repeat=5)
+
+    load_all(game)
+    results["assets.warm_load"] = measure(lambda: load_all(game), number=100)
+    return results
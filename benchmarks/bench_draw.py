@@ -0,0 +1,39 @@
+"""TeluguCookingGame.draw() in every state, always a full redraw.
+
+Static layers are cached after the first call; the *_rebuild entries
+measure a frame that has to render its layer again.
+"""
+from common import make_game, measure
+
+
+def set_screen(game, state, show_help=False):
+    game.current_recipe_index = 0
+    game.current_recipe = game.recipes[0]
+    # Entering a state sets up its mini-game
+    game.game_state.set_state(state)
+    game.show_help = show_help
+
+
+def run():
+    game = make_game()
+    screens = [
+        ("menu", "menu", False),
+        ("recipe_selection", "recipe_selection", False),
+        ("cooking_select", "select", False),
+        ("cooking_chop", "chop", False),
+        ("cooking_mix", "mix", False),
+        ("cooking_serve", "serve", False),
+        ("help_overlay", "select", True),
+    ]
+    results = {}
+    for name, state, show_help in screens:
+        set_screen(game, state, show_help)
+        results[f"draw.{name}"] = measure(game.draw, number=100)
+
+    def rebuild():
+        game.layers.clear()
+        game.draw()
+    set_screen(game, "select")
+    results["draw.cooking_select_rebuild"] = measure(rebuild, number=100)
+    set_screen(game, "menu")
+    return results
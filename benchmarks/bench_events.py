@@ -0,0 +1,48 @@
+"""handle_event under click and motion floods, and MixingGame stirring."""
+import math
+import random
+from common import click, make_game, measure, motion
+from mini_games import MixingGame
+
+
+def run():
+    game = make_game()
+    rng = random.Random(1)
+    results = {}
+
+    # Clicks anywhere on the ingredient selection screen
+    clicks = [click((rng.randrange(800), rng.randrange(700))) for _ in range(1000)]
+
+    def click_flood():
+        game.current_recipe = game.recipes[0]
+        game.game_state.set_state("select")
+        for event in clicks:
+            game.handle_event(event)
+            # Stay on the select screen even if every ingredient got picked
+            if game.game_state.current_state != "select":
+                game.game_state.set_state("select")
+    results["handle_event.select_click_flood_1000"] = measure(click_flood, number=5)
+
+    # Mouse motion over the recipe selection screen
+    motions = [motion((rng.randrange(800), rng.randrange(700)), (0, 0, 0)) for _ in range(1000)]
+
+    def motion_flood():
+        game.game_state.set_state("recipe_selection")
+        for event in motions:
+            game.handle_event(event)
+    results["handle_event.recipe_motion_flood_1000"] = measure(motion_flood, number=5)
+
+    # High-rate stirring: 1000 small steps around the bowl
+    center = MixingGame().center
+    stroke = [motion((int(center[0] + 80 * math.cos(a / 50)), int(center[1] + 80 * math.sin(a / 50))))
+              for a in range(1000)]
+
+    def stir():
+        mixing_game = MixingGame()
+        mixing_game.required_mixes = 10 ** 9  # Never finish mid-stroke
+        mixing_game.handle_event(click(center))
+        for event in stroke:
+            mixing_game.handle_event(event)
+        mixing_game.update(1 / 60)
+    results["mixing.stir_motion_1000"] = measure(stir, number=5)
+    return results
@@ -0,0 +1,65 @@
+"""Shared setup for the benchmark suite: headless drivers and timing helpers."""
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+# Benchmarks always run headless on the SDL dummy drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# The game modules live in src/ and import each other as top-level modules
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import pygame
+
+
+@contextlib.contextmanager
+def quiet():
+    """Hide the game's debug prints while measuring"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def measure(func, number=100, repeat=5):
+    """Time func() number times per round; return per-call statistics in microseconds"""
+    rounds = []
+    with quiet():
+        func()  # Warm-up call, not measured
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            rounds.append(1e6 * (time.perf_counter() - start) / number)
+    return {
+        "min_us": min(rounds),
+        "median_us": statistics.median(rounds),
+        "mean_us": statistics.mean(rounds),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+_game = None
+
+
+def make_game():
+    """Create the game once and reuse it between benchmarks"""
+    global _game
+    if _game is None:
+        from main import TeluguCookingGame
+        with quiet():
+            _game = TeluguCookingGame()
+    return _game
+
+
+def click(pos, event_type=pygame.MOUSEBUTTONDOWN):
+    return pygame.event.Event(event_type, pos=pos, button=1)
+
+
+def motion(pos, buttons=(1, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=buttons)
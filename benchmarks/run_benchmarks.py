@@ -0,0 +1,71 @@
+"""Run the benchmark suite headless and save the results as JSON.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--output results.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+
+import common
+import pygame
+import bench_assets
+import bench_draw
+import bench_events
+
+SUITES = [bench_draw, bench_events, bench_assets]
+
+
+def git_revision():
+    try:
+        # capture_output and text need Python 3.7
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True,
+                              cwd=common.src_dir).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline):
+    """Print the change in median time against a previous results file"""
+    print(f"{'benchmark':<44}{'baseline us':>14}{'now us':>12}{'change':>9}")
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        change = stats["median_us"] / old["median_us"] - 1 if old["median_us"] else 0.0
+        print(f"{name:<44}{old['median_us']:>14.1f}{stats['median_us']:>12.1f}{change:>+9.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render and event hot-path benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to save results")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args()
+
+    results = {}
+    for suite in SUITES:
+        results.update(suite.run())
+    for name, stats in results.items():
+        print(f"{name:<44}{stats['median_us']:>12.1f} us (min {stats['min_us']:.1f})")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "results": results,
+        }, f, indent=2)
+    print(f"Saved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f)["results"])
+
+
+if __name__ == "__main__":
+    main()
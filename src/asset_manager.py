@@ -0,0 +1,172 @@
+import json
+import os
+from collections import OrderedDict
+import pygame
+
+# Get the absolute path to the game directory
+game_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+images_dir = os.path.join(game_dir, "images")
+
+# Default memory cap for all cached images (decoded and scaled)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+def scale_image(image, size):
+    """Smoothly scale an image, copying it to 32 bits first if it is paletted"""
+    if image.get_bitsize() < 24:
+        rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(image, (0, 0))
+        image = rgba
+    return pygame.transform.smoothscale(image, size)
+
+
+class AssetManager:
+    """Owns all image loading so every file is decoded and scaled only once.
+
+    Both caches are LRUs that share one memory cap. Decoded source images
+    are evicted first since any scaled variant can be rebuilt from the file.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # Decoded source images keyed by path
+        self.decoded = OrderedDict()
+        # Display-ready surfaces keyed by (path, size); each entry is
+        # [surface, alpha, converted]
+        self.surfaces = OrderedDict()
+        # Pre-scaled sprites from a texture atlas, keyed like surfaces. They
+        # share the atlas pixels so they are not counted against the cap.
+        self.atlas_sprites = {}
+
+    def image_path(self, file_name):
+        """Return the absolute path of a file in the images directory"""
+        return os.path.join(images_dir, file_name)
+
+    def get_image(self, path, size=None, alpha=False, fallback_color=None):
+        """Return the image at path scaled to size, loading it on first use.
+
+        When fallback_color is given a solid placeholder is cached instead of
+        raising, so a missing file is only reported once.
+        """
+        key = (path, tuple(size) if size else None)
+        sprite = self.atlas_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.surfaces.move_to_end(key)
+            return self.ready(entry)
+
+        try:
+            image = self.decode(path)
+            if key[1] and image.get_size() != key[1]:
+                image = scale_image(image, key[1])
+        except (pygame.error, FileNotFoundError) as e:
+            if fallback_color is None:
+                raise
+            image = self.placeholder(path, key[1], fallback_color, e)
+        return self.store(path, key[1], image, alpha)
+
+    def has_image(self, path, size=None):
+        key = (path, tuple(size) if size else None)
+        return key in self.atlas_sprites or key in self.surfaces
+
+    def store(self, path, size, image, alpha=False):
+        """Cache an already decoded and scaled image, e.g. from a loader thread"""
+        key = (path, tuple(size) if size else None)
+        old = self.surfaces.pop(key, None)
+        if old is not None:
+            self.total_bytes -= surface_bytes(old[0])
+        entry = [image, alpha, False]
+        self.surfaces[key] = entry
+        self.total_bytes += surface_bytes(image)
+        return self.ready(entry)
+
+    def placeholder(self, path, size, fallback_color, error):
+        """Solid-colour stand-in for an image that could not be loaded"""
+        print(f"Could not load image: {path}")
+        print(f"Error: {error}")
+        image = pygame.Surface(size or (64, 64))
+        image.fill(fallback_color)
+        return image
+
+    def ready(self, entry):
+        """Convert an entry to the display format once a display exists"""
+        if not entry[2] and pygame.display.get_surface() is not None:
+            self.total_bytes -= surface_bytes(entry[0])
+            entry[0] = entry[0].convert_alpha() if entry[1] else entry[0].convert()
+            entry[2] = True
+            self.total_bytes += surface_bytes(entry[0])
+        surface = entry[0]
+        self.evict()
+        return surface
+
+    def load_atlas(self, index_path):
+        """Register the sprites of an atlas built by build_atlas.py.
+
+        Returns the number of sprites registered; a missing atlas is not an
+        error since every sprite can still be loaded from its own file.
+        """
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            atlas = pygame.image.load(os.path.join(os.path.dirname(index_path), index["image"]))
+        except (OSError, ValueError, KeyError, pygame.error):
+            return 0
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+
+        count = 0
+        for sprite in index["sprites"].values():
+            path = self.image_path(sprite["file"])
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            # Skip sprites whose source image changed after the atlas was built
+            if stat.st_mtime_ns != sprite["mtime_ns"] or stat.st_size != sprite["bytes"]:
+                continue
+            rect = pygame.Rect(sprite["rect"])
+            self.atlas_sprites[(path, rect.size)] = atlas.subsurface(rect)
+            count += 1
+        return count
+
+    def decode(self, path):
+        """Decode an image file, reusing the result for later sizes"""
+        image = self.decoded.get(path)
+        if image is None:
+            image = pygame.image.load(path)
+            self.decoded[path] = image
+            self.total_bytes += surface_bytes(image)
+        else:
+            self.decoded.move_to_end(path)
+        return image
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used images until the caches fit the cap"""
+        while self.total_bytes > self.max_bytes and self.decoded:
+            _, image = self.decoded.popitem(last=False)
+            self.total_bytes -= surface_bytes(image)
+        # Always keep the most recent surface, it is about to be drawn
+        while self.total_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, entry = self.surfaces.popitem(last=False)
+            self.total_bytes -= surface_bytes(entry[0])
+
+    def clear(self):
+        self.decoded.clear()
+        self.surfaces.clear()
+        self.atlas_sprites.clear()
+        self.total_bytes = 0
+
+
+# Shared instance used by the game, ingredients and mini-games
+asset_manager = AssetManager()
@@ -0,0 +1,119 @@
+import os
+import pygame
+from asset_manager import game_dir
+
+sounds_dir = os.path.join(game_dir, "sounds")
+
+# Mixer output format. A small buffer keeps the delay between a click and
+# its sound short; raise it if playback crackles on slow machines.
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+DEFAULT_BUFFER = 256
+
+# Cue categories: (reserved channels, minimum milliseconds between plays of one cue)
+CATEGORIES = {
+    "ingredient": (2, 40),
+    "error": (1, 80),
+    "stage": (1, 0),
+}
+
+# Cue name -> (sound file, category)
+CUES = {
+    "ingredient_ok": ("success.wav", "ingredient"),
+    "ingredient_wrong": ("error.wav", "error"),
+    "stage_complete": ("success.wav", "stage"),
+}
+
+
+class AudioEngine:
+    """Plays named sound cues on channels reserved for their category.
+
+    Each category owns a fixed set of mixer channels, so a burst of one
+    kind of cue can never starve another. When all of a category's
+    channels are busy the oldest voice is stolen, and a cue repeated
+    faster than its category allows is dropped instead of queued.
+    """
+
+    def __init__(self, categories=CATEGORIES, cues=CUES):
+        self.categories = categories
+        self.cues = cues
+        self.enabled = False
+        # Loaded sounds keyed by file name, shared by every cue using the file
+        self.bank = {}
+        # Category -> list of its channels, assigned by init()
+        self.channels = {}
+        # Channel -> tick it last started playing, for voice stealing
+        self.started = {}
+        # Cue -> tick it was last played, for rate limiting
+        self.last_played = {}
+        self.stats = {"played": 0, "stolen": 0, "limited": 0}
+
+    def pre_init(self, buffer=DEFAULT_BUFFER):
+        """Set the mixer format; must run before pygame.init()"""
+        pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, buffer)
+
+    def init(self):
+        """Open the mixer and reserve each category's channels"""
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Audio disabled: {e}")
+            self.enabled = False
+            return
+        self.enabled = True
+        reserved = sum(count for count, _ in self.categories.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+        # Reserved channels are never handed out by Sound.play()
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for category, (count, _) in self.categories.items():
+            self.channels[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+
+    def sound_paths(self):
+        """Files the cues need, to be loaded once into the bank"""
+        return sorted({os.path.join(sounds_dir, file_name) for file_name, _ in self.cues.values()})
+
+    def add_sound(self, path, sound):
+        """Put a loaded sound in the bank; None marks a sound that failed to load.
+
+        pygame converts a Sound to the mixer's format while loading it, so
+        the mixer must be initialised first and nothing is resampled on play.
+        """
+        self.bank[os.path.basename(path)] = sound
+
+    def missing_sounds(self):
+        return sorted(name for name, sound in self.bank.items() if sound is None)
+
+    def play(self, cue):
+        """Play a cue; returns the channel used, or None if it was skipped"""
+        if not self.enabled:
+            return None
+        file_name, category = self.cues[cue]
+        sound = self.bank.get(file_name)
+        if sound is None:
+            return None
+
+        now = pygame.time.get_ticks()
+        min_interval = self.categories[category][1]
+        last = self.last_played.get(cue)
+        if last is not None and now - last < min_interval:
+            self.stats["limited"] += 1
+            return None
+
+        channels = self.channels[category]
+        channel = next((c for c in channels if not c.get_busy()), None)
+        if channel is None:
+            # Steal the voice that has been playing longest
+            channel = min(channels, key=lambda c: self.started.get(c, 0))
+            self.stats["stolen"] += 1
+        channel.play(sound)
+        self.started[channel] = now
+        self.last_played[cue] = now
+        self.stats["played"] += 1
+        return channel
+
+
+# Shared instance used by the game
+audio = AudioEngine()
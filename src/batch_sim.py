@@ -0,0 +1,322 @@
+"""Simulate mini-game plays in bulk to balance their difficulty.
+
+Bots with a skill model (reaction time, accuracy, stirring and dragging
+speed) play ChoppingGame, MixingGame and ServingGame directly, without a
+window. Plays are split into shards and run on a process pool; each shard
+sends back a histogram of completion times and a timeout count, which are
+merged as they arrive.
+
+Example:
+    python src/batch_sim.py --plays 100000 --skills novice expert --time-limit 8
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Workers never open a window, but make sure nothing can
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from mini_games import ChoppingGame, MixingGame, ServingGame
+
+SIMULATION_STEP = 1 / 60
+
+
+class SkillModel:
+    """How well a simulated player plays.
+
+    Reaction times are drawn per action from a normal distribution;
+    stirring and dragging speeds are in degrees and pixels per frame.
+    """
+
+    def __init__(self, name, reaction=0.5, reaction_spread=0.15, accuracy=0.9,
+                 stir_speed=10.0, stir_wobble=6.0, drag_speed=8.0, drop_error=15.0):
+        self.name = name
+        self.reaction = reaction
+        self.reaction_spread = reaction_spread
+        self.accuracy = accuracy
+        self.stir_speed = stir_speed
+        self.stir_wobble = stir_wobble
+        self.drag_speed = drag_speed
+        self.drop_error = drop_error
+
+    def reaction_time(self, rng):
+        # Nobody reacts faster than about a tenth of a second
+        return max(0.1, rng.gauss(self.reaction, self.reaction_spread))
+
+
+SKILLS = {
+    "novice": SkillModel("novice", reaction=0.8, reaction_spread=0.25, accuracy=0.7,
+                         stir_speed=6.0, stir_wobble=8.0, drag_speed=5.0, drop_error=30.0),
+    "average": SkillModel("average"),
+    "expert": SkillModel("expert", reaction=0.3, reaction_spread=0.08, accuracy=0.97,
+                         stir_speed=16.0, stir_wobble=3.0, drag_speed=12.0, drop_error=6.0),
+}
+
+
+def click(pos, event_type=pygame.MOUSEBUTTONDOWN):
+    return pygame.event.Event(event_type, pos=pos, button=1)
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0))
+
+
+class ChopBot:
+    """Aims at the highlighted area, then clicks once it has reacted.
+
+    The area may have moved on by then, and a miss lands on another area.
+    """
+
+    def __init__(self, skill, rng):
+        self.skill = skill
+        self.rng = rng
+        self.target = None
+        self.click_at = 0.0
+
+    def events(self, game, t):
+        if self.target is None:
+            self.target = game.active_area
+            self.click_at = t + self.skill.reaction_time(self.rng)
+            return []
+        if t < self.click_at:
+            return []
+        target = self.target
+        if self.rng.random() > self.skill.accuracy:
+            target = self.rng.choice([area for area in game.chop_areas if area != target])
+        self.target = None
+        return [click(target.center)]
+
+
+class MixBot:
+    """Holds the button down and circles the bowl at an unsteady speed"""
+
+    radius = 80
+
+    def __init__(self, skill, rng):
+        self.skill = skill
+        self.rng = rng
+        self.angle = None
+        self.start_at = skill.reaction_time(rng)
+
+    def events(self, game, t):
+        if t < self.start_at:
+            return []
+        events = []
+        if self.angle is None:
+            self.angle = 0.0
+            events.append(click(self.position(game)))
+        self.angle += self.rng.gauss(self.skill.stir_speed, self.skill.stir_wobble)
+        events.append(motion(self.position(game)))
+        return events
+
+    def position(self, game):
+        a = math.radians(self.angle)
+        return (int(game.center[0] + self.radius * math.cos(a)),
+                int(game.center[1] + self.radius * math.sin(a)))
+
+
+class ServeBot:
+    """Grabs the food, drags it towards the plate and lets go near its centre.
+
+    A drop that misses the plate is picked up again after another reaction.
+    """
+
+    def __init__(self, skill, rng):
+        self.skill = skill
+        self.rng = rng
+        self.grab_at = skill.reaction_time(rng)
+        self.aim = None
+
+    def events(self, game, t):
+        if not game.dragging:
+            if t < self.grab_at:
+                return []
+            self.aim = (game.plate_rect.centerx + self.rng.gauss(0, self.skill.drop_error),
+                        game.plate_rect.centery + self.rng.gauss(0, self.skill.drop_error))
+            return [click(game.food_rect.center)]
+
+        x, y = game.food_rect.center
+        dx, dy = self.aim[0] - x, self.aim[1] - y
+        distance = math.hypot(dx, dy)
+        if distance <= self.skill.drag_speed:
+            self.grab_at = t + self.skill.reaction_time(self.rng)
+            pos = (int(self.aim[0]), int(self.aim[1]))
+            return [motion(pos), click(pos, pygame.MOUSEBUTTONUP)]
+        step = self.skill.drag_speed / distance
+        return [motion((int(x + dx * step), int(y + dy * step)))]
+
+
+# Mini-game name -> (mini-game class, bot class)
+GAMES = {
+    "chop": (ChoppingGame, ChopBot),
+    "mix": (MixingGame, MixBot),
+    "serve": (ServingGame, ServeBot),
+}
+
+
+def play(game, bot, max_seconds):
+    """Run one play at the fixed simulation step; returns (result, seconds)"""
+    t = 0.0
+    while t < max_seconds:
+        for event in bot.events(game, t):
+            result = game.handle_event(event)
+            if result:
+                return result, t
+        result = game.update(SIMULATION_STEP)
+        if result:
+            return result, t
+        t += SIMULATION_STEP
+    return "timeout", t
+
+
+def configure(game, settings):
+    """Apply the balancing values under test to a fresh mini-game"""
+    for name, value in settings.items():
+        if value is not None and hasattr(game, name):
+            setattr(game, name, value)
+
+
+def run_shard(game_name, skill_name, plays, seed, settings, max_seconds, bin_width):
+    """Play one shard of games; the seed makes the shard reproducible on any worker"""
+    rng = random.Random(seed)
+    game_class, bot_class = GAMES[game_name]
+    skill = SKILLS[skill_name]
+    histogram = Counter()
+    timeouts = 0
+    total = 0.0
+    for _ in range(plays):
+        game = game_class(rng=random.Random(rng.getrandbits(32)))
+        configure(game, settings)
+        result, seconds = play(game, bot_class(skill, rng), max_seconds)
+        if result == "completed":
+            histogram[int(seconds / bin_width)] += 1
+            total += seconds
+        else:
+            timeouts += 1
+    return {"game": game_name, "skill": skill_name, "plays": plays, "timeouts": timeouts,
+            "total_seconds": total, "histogram": histogram}
+
+
+def shard_tasks(games, skills, plays, shard_size, seed):
+    """Split every (game, skill) pair into shards with their own seeds"""
+    seeds = random.Random(seed)
+    for game_name in games:
+        for skill_name in skills:
+            remaining = plays
+            while remaining > 0:
+                size = min(shard_size, remaining)
+                remaining -= size
+                yield game_name, skill_name, size, seeds.getrandbits(64)
+
+
+def merge(totals, shard):
+    key = (shard["game"], shard["skill"])
+    total = totals.setdefault(key, {"plays": 0, "timeouts": 0, "total_seconds": 0.0,
+                                    "histogram": Counter()})
+    total["plays"] += shard["plays"]
+    total["timeouts"] += shard["timeouts"]
+    total["total_seconds"] += shard["total_seconds"]
+    total["histogram"].update(shard["histogram"])
+
+
+def percentile(histogram, fraction, bin_width):
+    """Upper edge of the bin holding the given fraction of completed plays"""
+    count = sum(histogram.values())
+    if not count:
+        return None
+    seen = 0
+    for index in sorted(histogram):
+        seen += histogram[index]
+        if seen >= fraction * count:
+            return (index + 1) * bin_width
+    return None
+
+
+def run_batch(games, skills, plays, settings, workers=None, shard_size=1000, seed=0,
+              max_seconds=60.0, bin_width=0.25):
+    """Run every shard on a process pool, merging results as they arrive"""
+    totals = {}
+    tasks = list(shard_tasks(games, skills, plays, shard_size, seed))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_shard, game_name, skill_name, size, shard_seed,
+                               settings, max_seconds, bin_width)
+                   for game_name, skill_name, size, shard_seed in tasks]
+        step = max(1, len(futures) // 10)
+        for done, future in enumerate(as_completed(futures), 1):
+            merge(totals, future.result())
+            if done % step == 0 or done == len(futures):
+                print(f"{done}/{len(futures)} shards done ({time.perf_counter() - start:.1f}s)")
+    return totals, time.perf_counter() - start
+
+
+def summarize(totals, bin_width):
+    report = {}
+    # Shards finish in any order; report in the order the games and skills are defined
+    order = sorted(totals, key=lambda key: (list(GAMES).index(key[0]), list(SKILLS).index(key[1])))
+    for game_name, skill_name in order:
+        total = totals[(game_name, skill_name)]
+        completed = total["plays"] - total["timeouts"]
+        report[f"{game_name}/{skill_name}"] = {
+            "plays": total["plays"],
+            "timeout_rate": total["timeouts"] / total["plays"],
+            "mean_seconds": total["total_seconds"] / completed if completed else None,
+            "p50_seconds": percentile(total["histogram"], 0.5, bin_width),
+            "p95_seconds": percentile(total["histogram"], 0.95, bin_width),
+            "histogram": {f"{index * bin_width:.2f}": count
+                          for index, count in sorted(total["histogram"].items())},
+        }
+    return report
+
+
+def print_report(report, seconds):
+    plays = sum(stats["plays"] for stats in report.values())
+    print(f"Plays: {plays} in {seconds:.2f}s ({plays / seconds:.0f} plays/s)")
+    print(f"{'game/skill':<18}{'plays':>10}{'timeout':>10}{'mean s':>9}{'p50 s':>8}{'p95 s':>8}")
+    for name, stats in report.items():
+        mean = "-" if stats["mean_seconds"] is None else f"{stats['mean_seconds']:.2f}"
+        p50 = "-" if stats["p50_seconds"] is None else f"{stats['p50_seconds']:.2f}"
+        p95 = "-" if stats["p95_seconds"] is None else f"{stats['p95_seconds']:.2f}"
+        print(f"{name:<18}{stats['plays']:>10}{stats['timeout_rate']:>9.1%}{mean:>9}{p50:>8}{p95:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-simulate mini-game plays with bot skill models")
+    parser.add_argument("--plays", type=int, default=10000, help="plays per mini-game and skill")
+    parser.add_argument("--games", nargs="+", choices=sorted(GAMES), default=list(GAMES))
+    parser.add_argument("--skills", nargs="+", choices=sorted(SKILLS), default=list(SKILLS))
+    parser.add_argument("--required-chops", type=int, help="override ChoppingGame.required_chops")
+    parser.add_argument("--required-mixes", type=int, help="override MixingGame.required_mixes")
+    parser.add_argument("--time-limit", type=float, help="override ServingGame.time_limit (seconds)")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="give up on plays without a time limit after this long")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--shard-size", type=int, default=1000, help="plays per task sent to a worker")
+    parser.add_argument("--bin", type=float, default=0.25, help="histogram bin width in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="seed all shards are derived from")
+    parser.add_argument("--json", help="also write the report, with histograms, to this file")
+    args = parser.parse_args()
+
+    settings = {
+        "required_chops": args.required_chops,
+        "required_mixes": args.required_mixes,
+        "time_limit": args.time_limit,
+    }
+    totals, seconds = run_batch(args.games, args.skills, args.plays, settings, args.workers,
+                                args.shard_size, args.seed, args.max_seconds, args.bin)
+    report = summarize(totals, args.bin)
+    print_report(report, seconds)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Pack the ingredient sprites into a single pre-scaled texture atlas.
+
+Every image referenced by the ingredient catalog is scaled to each sprite
+size the game draws it at and packed into images/atlas/ingredients.png,
+with an index in images/atlas/ingredients.json. At startup the game
+loads the atlas once and hands out subsurfaces of it, so there is no
+per-file decode or runtime scaling. Images that changed after the atlas
+was built are skipped and loaded from their own file.
+
+Usage:
+    python src/build_atlas.py [--padding 2] [--max-width 1024]
+"""
+import argparse
+import json
+import os
+
+import pygame
+from asset_manager import images_dir
+from catalog import load_catalog
+
+atlas_dir = os.path.join(images_dir, "atlas")
+ATLAS_IMAGE = os.path.join(atlas_dir, "ingredients.png")
+ATLAS_INDEX = os.path.join(atlas_dir, "ingredients.json")
+
+# Sizes the game draws ingredient sprites at
+SPRITE_SIZES = [(64, 64)]
+
+
+def sprite_key(file_name, size):
+    return f"{file_name}@{size[0]}x{size[1]}"
+
+
+def pack_shelves(sizes, max_width, padding):
+    """Place rects of the given sizes on horizontal shelves.
+
+    Returns a list of (x, y) positions in the same order and the total
+    (width, height) of the atlas.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+    return positions, (width, y + shelf_height)
+
+
+def build_atlas(padding=2, max_width=1024):
+    pygame.init()
+    catalog = load_catalog()
+    file_names = sorted(set(catalog.ingredient_images))
+
+    sprites = []
+    for file_name in file_names:
+        path = os.path.join(images_dir, file_name)
+        try:
+            source = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Skipping {file_name}: {e}")
+            continue
+        # Copy onto a 32-bit surface so smoothscale accepts every format
+        rgba = pygame.Surface(source.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(source, (0, 0))
+        stat = os.stat(path)
+        for size in SPRITE_SIZES:
+            sprites.append((file_name, size, pygame.transform.smoothscale(rgba, size), stat))
+
+    positions, atlas_size = pack_shelves([s[1] for s in sprites], max_width, padding)
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA, 32)
+    index = {"image": os.path.basename(ATLAS_IMAGE), "sprites": {}}
+    for (file_name, size, surface, stat), pos in zip(sprites, positions):
+        atlas.blit(surface, pos)
+        index["sprites"][sprite_key(file_name, size)] = {
+            "file": file_name,
+            "rect": [pos[0], pos[1], size[0], size[1]],
+            # Lets the game ignore sprites whose source image has changed
+            "mtime_ns": stat.st_mtime_ns,
+            "bytes": stat.st_size,
+        }
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    pygame.image.save(atlas, ATLAS_IMAGE)
+    with open(ATLAS_INDEX, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    print(f"Packed {len(sprites)} sprites into {atlas_size[0]}x{atlas_size[1]} atlas: {ATLAS_IMAGE}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the ingredient sprite atlas")
+    parser.add_argument("--padding", type=int, default=2, help="pixels between sprites")
+    parser.add_argument("--max-width", type=int, default=1024, help="maximum atlas width")
+    args = parser.parse_args()
+    build_atlas(args.padding, args.max_width)
+
+
+if __name__ == "__main__":
+    main()
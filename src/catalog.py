@@ -0,0 +1,144 @@
+import json
+import os
+import pickle
+import sys
+from asset_manager import game_dir
+from recipe import Recipe
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+data_dir = os.path.join(game_dir, "data")
+
+# Bump when the layout of the compiled index changes
+CATALOG_FORMAT = 2
+
+
+class CatalogError(ValueError):
+    """Raised when the recipe or ingredient data is invalid"""
+
+
+class Catalog:
+    """Recipes and ingredients loaded from the data files.
+
+    Ingredients are interned to integer IDs (their position in the
+    ingredient table) and every Recipe carries a frozenset of those IDs.
+    """
+
+    def __init__(self, ingredient_names, ingredient_images, ingredient_colors, recipes):
+        self.ingredient_names = ingredient_names
+        self.ingredient_images = ingredient_images
+        self.ingredient_colors = ingredient_colors
+        self.ingredient_ids = {name: i for i, name in enumerate(ingredient_names)}
+        self.recipes = [Recipe(name, [ingredient_names[i] for i in ids], instructions, ids,
+                               background, dict(stage_backgrounds))
+                        for name, ids, instructions, background, stage_backgrounds in recipes]
+
+    def ingredient_entries(self):
+        """Yield (id, name, image file, colour) for each ingredient"""
+        for i, name in enumerate(self.ingredient_names):
+            yield i, name, self.ingredient_images[i], self.ingredient_colors[i]
+
+
+def read_data_file(path):
+    """Read a JSON or TOML data file"""
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise CatalogError(f"TOML catalogs need Python 3.11 or newer: {path}")
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    # A TOML file can only hold tables at the top level, so accept
+    # {"ingredients": [...]} / {"recipes": [...]} as well as a bare list
+    if isinstance(data, dict):
+        data = data.get("ingredients", data.get("recipes"))
+    if not isinstance(data, list):
+        raise CatalogError(f"Expected a list of entries in {path}")
+    return data
+
+
+def compile_catalog(ingredients, recipes):
+    """Validate the raw data and compile it into plain, picklable tables"""
+    errors = []
+    names, images, colors = [], [], []
+    ids = {}
+    for entry in ingredients:
+        name = entry.get("name")
+        if not name or not entry.get("image"):
+            errors.append(f"Ingredient needs a name and an image: {entry}")
+            continue
+        if name in ids:
+            errors.append(f"Duplicate ingredient: {name}")
+            continue
+        ids[name] = len(names)
+        names.append(name)
+        images.append(entry["image"])
+        colors.append(tuple(entry.get("color", (200, 200, 200))))
+
+    compiled_recipes = []
+    recipe_names = set()
+    for entry in recipes:
+        name = entry.get("name")
+        if not name or not entry.get("ingredients"):
+            errors.append(f"Recipe needs a name and ingredients: {entry}")
+            continue
+        if name in recipe_names:
+            errors.append(f"Duplicate recipe: {name}")
+            continue
+        recipe_names.add(name)
+        unknown = [i for i in entry["ingredients"] if i not in ids]
+        if unknown:
+            errors.append(f"Recipe {name} uses unknown ingredients: {', '.join(unknown)}")
+            continue
+        stage_backgrounds = entry.get("stage_backgrounds", {})
+        if not isinstance(stage_backgrounds, dict):
+            errors.append(f"Recipe {name} stage_backgrounds must map stage names to images")
+            continue
+        ingredient_ids = tuple(dict.fromkeys(ids[i] for i in entry["ingredients"]))
+        compiled_recipes.append((name, ingredient_ids, entry.get("instructions", ""),
+                                 entry.get("background", "kitchen_background.png"),
+                                 tuple(sorted(stage_backgrounds.items()))))
+
+    if errors:
+        raise CatalogError("Invalid catalog:\n  " + "\n  ".join(errors))
+    return {"names": names, "images": images, "colors": colors, "recipes": compiled_recipes}
+
+
+def source_signature(paths):
+    """Identify the exact source files a compiled index was built from"""
+    signature = [CATALOG_FORMAT, sys.version_info[:2]]
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+    return signature
+
+
+def load_catalog(ingredients_path=None, recipes_path=None, cache_path=None):
+    """Load the catalog, using the compiled index unless a source file changed"""
+    ingredients_path = ingredients_path or os.path.join(data_dir, "ingredients.json")
+    recipes_path = recipes_path or os.path.join(data_dir, "recipes.json")
+    cache_path = cache_path or os.path.join(data_dir, "catalog.cache")
+    signature = source_signature([ingredients_path, recipes_path])
+
+    tables = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("signature") == signature:
+            tables = cached["tables"]
+    except (OSError, pickle.PickleError, EOFError, AttributeError, KeyError):
+        pass
+
+    if tables is None:
+        tables = compile_catalog(read_data_file(ingredients_path), read_data_file(recipes_path))
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump({"signature": signature, "tables": tables}, f, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Could not write catalog cache: {e}")
+
+    return Catalog(tables["names"], tables["images"], tables["colors"], tables["recipes"])
@@ -0,0 +1,41 @@
+import pygame
+
+# System fonts that can render Telugu, in order of preference
+TELUGU_FONT_NAMES = "Arial Unicode MS, Nirmala UI, Mangal, Latha"
+
+# Fonts the game uses, opened once at startup so frames never open a font
+DEFAULT_FONTS = [
+    (TELUGU_FONT_NAMES, 24),  # Titles and buttons
+    (TELUGU_FONT_NAMES, 18),  # Ingredient names, instructions and help lines
+    (None, 36),               # Mini-game progress and timer text
+    (None, 18),               # Frame-time overlay
+]
+
+
+class FontRegistry:
+    """Resolves and opens each (name, size) font exactly once"""
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, name, size):
+        """Return the font for name at size, opening it on first use"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            # SysFont does the system lookup and opens the file; name=None
+            # gives pygame's default font
+            font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def preload(self, specs=DEFAULT_FONTS):
+        """Open a set of (name, size) fonts ahead of the first frame"""
+        for name, size in specs:
+            self.get(name, size)
+
+
+# Shared instance used by the game and mini-games
+font_registry = FontRegistry()
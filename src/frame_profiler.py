@@ -0,0 +1,134 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+import pygame
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class FrameProfiler:
+    """Times each phase of a frame and each mini-game method.
+
+    Keeps a rolling window of samples per section for p50/p95/p99, counts
+    frames whose work exceeded the frame budget, and records a per-frame
+    trace that can be dumped as JSON or CSV for offline analysis.
+    """
+
+    def __init__(self, budget_ms, window=600, max_trace_frames=100000):
+        self.budget_ms = budget_ms
+        self.window = window
+        # Rolling samples in milliseconds, keyed by section name
+        self.samples = {}
+        self.trace = deque(maxlen=max_trace_frames)
+        self.frame_index = 0
+        self.dropped_frames = 0
+        self.frame_start = None
+        self.current = {}
+        self.show_overlay = False
+        self.overlay_rect = pygame.Rect(10, 10, 0, 0)
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_sample(name, 1000 * (time.perf_counter() - start))
+
+    def add_sample(self, name, ms):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(ms)
+        # A section can run more than once per frame (one call per event)
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.current = {}
+
+    def end_frame(self):
+        """Finish the frame; time spent waiting for input is not counted"""
+        frame_ms = 1000 * (time.perf_counter() - self.frame_start)
+        self.add_sample("frame", frame_ms)
+        if frame_ms > self.budget_ms:
+            self.dropped_frames += 1
+        self.trace.append((self.frame_index, self.current))
+        self.frame_index += 1
+
+    def stats(self):
+        """Return {section: {"p50", "p95", "p99", "count"}} over the rolling window"""
+        result = {}
+        for name, samples in self.samples.items():
+            values = sorted(samples)
+            result[name] = {
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "count": len(values),
+            }
+        return result
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self, screen, font):
+        """Draw the percentile table in the top-left corner"""
+        stats = self.stats()
+        lines = [f"frames {self.frame_index}  dropped {self.dropped_frames}  (ms p50/p95/p99)"]
+        for name in sorted(stats):
+            s = stats[name]
+            lines.append(f"{name:<24} {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f}")
+        # Numbers change every frame, so these are not worth caching
+        texts = [font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = font.get_linesize()
+        self.overlay_rect.size = (10 + max(text.get_width() for text in texts),
+                                  10 + line_height * len(texts))
+        panel = pygame.Surface(self.overlay_rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        screen.blit(panel, self.overlay_rect)
+        for i, text in enumerate(texts):
+            screen.blit(text, (self.overlay_rect.x + 5, self.overlay_rect.y + 5 + i * line_height))
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "budget_ms": self.budget_ms,
+                "frames": self.frame_index,
+                "dropped_frames": self.dropped_frames,
+                "summary": self.stats(),
+                "trace": [{"frame": index, "sections": sections} for index, sections in self.trace],
+            }, f, indent=1)
+
+    def dump_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "section", "ms"])
+            for index, sections in self.trace:
+                for name, ms in sections.items():
+                    writer.writerow([index, name, f"{ms:.4f}"])
+
+
+class NullProfiler:
+    """Stands in for FrameProfiler where frames are not timed, e.g. server sessions"""
+
+    show_overlay = False
+
+    @contextmanager
+    def section(self, name):
+        yield
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def toggle_overlay(self):
+        pass
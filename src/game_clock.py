@@ -0,0 +1,50 @@
+import time
+
+
+class GameClock:
+    """Measures real frame time and converts it into fixed simulation steps.
+
+    Gameplay advances in steps of exactly `step` seconds however fast or
+    slow frames are rendered; leftover time is carried over to the next
+    frame, and alpha says how far the simulation is between two steps.
+
+    The game itself draws the latest step as is: dragged food follows the
+    mouse events directly and the serving countdown is shown in whole
+    seconds, so nothing would look different blended. Interpolation is
+    left to callers that animate between steps, using alpha.
+    """
+
+    def __init__(self, step=1 / 60, max_frame_time=0.25):
+        self.step = step
+        # Longest frame simulated in full; protects against a spiral of
+        # catch-up steps after a stall
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def tick(self):
+        """Return the real time in seconds since the previous tick"""
+        now = time.perf_counter()
+        dt = 0.0 if self.last_time is None else now - self.last_time
+        self.last_time = now
+        return min(dt, self.max_frame_time)
+
+    def advance(self, dt):
+        """Add dt seconds and return how many fixed steps to simulate"""
+        self.accumulator += dt
+        steps = int(self.accumulator // self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step left over, 0 <= alpha < 1.
+
+        A caller animating something can draw it at
+        previous + (current - previous) * alpha to hide the step rate.
+        """
+        return self.accumulator / self.step
+
+    def reset(self):
+        """Drop accumulated time, e.g. after idling with nothing to simulate"""
+        self.accumulator = 0.0
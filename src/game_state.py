@@ -1,13 +1,79 @@
+class State:
+    """One screen of the game and the handlers that drive it.
+
+    Handlers are plain callables; any that are not given do nothing.
+    draw_static(surface) renders the parts of the screen that only change
+    with the game's layer key, draw() whatever changes every frame.
+    Cooking states share the recipe header and use the recipe's backgrounds.
+    """
+
+    def __init__(self, name, handle_event=None, update=None, draw=None, draw_static=None,
+                 enter=None, exit=None, cooking=False):
+        self.name = name
+        self.handle_event = handle_event or ignore
+        self.update = update or ignore
+        self.draw = draw or ignore
+        self.draw_static = draw_static or ignore
+        self.enter = enter or ignore
+        self.exit = exit or ignore
+        self.cooking = cooking
+
+
+def ignore(*args):
+    pass
+
+
 class GameState:
+    """State machine of registered screens and a (state, trigger) -> state table"""
+
     def __init__(self):
-        self.states = ["menu", "recipe_selection", "cooking", "result"]
-        self.current_state = "menu"
-    
+        self.states = {}
+        self.transitions = {}
+        self.current = None
+        self.current_state = None
+
+    def add_state(self, state):
+        self.states[state.name] = state
+
+    def add_transition(self, source, trigger, target):
+        self.transitions[(source, trigger)] = target
+
     def set_state(self, state):
-        if state in self.states:
-            self.current_state = state
-        else:
+        """Switch to the named state directly, running its enter/exit handlers"""
+        new = self.states.get(state)
+        if new is None:
             print(f"Invalid state: {state}")
-    
+            return
+        if self.current is not None:
+            self.current.exit()
+        self.current = new
+        self.current_state = state
+        new.enter()
+
+    def fire(self, trigger):
+        """Follow the transition for trigger from the current state"""
+        target = self.transitions.get((self.current_state, trigger))
+        if target is None:
+            print(f"No transition for {trigger} from {self.current_state}")
+            return False
+        self.set_state(target)
+        return True
+
+    def next_state(self, trigger):
+        """Name of the state trigger would lead to, without switching"""
+        return self.transitions.get((self.current_state, trigger))
+
     def get_state(self):
         return self.current_state
+
+    def handle_event(self, event):
+        self.current.handle_event(event)
+
+    def update(self, dt):
+        self.current.update(dt)
+
+    def draw(self):
+        self.current.draw()
+
+    def draw_static(self, surface):
+        self.current.draw_static(surface)
@@ -0,0 +1,218 @@
+"""Run the game without a window, driven by a bot, for throughput testing.
+
+Example:
+    python src/headless.py --games 1000 --bot random --seed 1
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+# The dummy drivers must be selected before pygame creates a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from main import TeluguCookingGame
+
+STAGES = ["menu", "recipe_selection", "select", "chop", "mix", "serve"]
+# Somewhere on screen that is not a widget, used for deliberate misses
+SCREEN_BOTTOM = 680
+
+
+class CookBot:
+    """Synthesizes mouse events for whatever screen the game is showing.
+
+    The "scripted" bot plays perfectly; the "random" bot picks recipes at
+    random and sometimes clicks the wrong ingredient or misses a chop.
+    """
+
+    def __init__(self, mode="scripted", seed=None, mistake_rate=0.2):
+        self.mode = mode
+        self.rng = random.Random(seed)
+        self.mistake_rate = mistake_rate if mode == "random" else 0.0
+        self.next_recipe = 0
+        # Recipe being scrolled to on the selection screen
+        self.recipe = None
+        self.mix_angle = 0.0
+        self.serve_step = 0
+
+    def events_for(self, game):
+        """Return the list of events to feed the game this frame"""
+        stage = game_stage(game)
+        if stage == "menu":
+            return [click(game.start_button_rect.center)]
+        if stage == "recipe_selection":
+            return self.choose_recipe(game)
+        if stage == "select":
+            return [click(self.pick_ingredient(game))]
+        if stage == "chop":
+            if self.mistake():
+                return [click((20, SCREEN_BOTTOM))]
+            return [click(game.mini_game.active_area.center)]
+        if stage == "mix":
+            return self.stir(game.mini_game)
+        if stage == "serve":
+            return self.serve(game.mini_game)
+        return []
+
+    def mistake(self):
+        return self.mistake_rate and self.rng.random() < self.mistake_rate
+
+    def choose_recipe(self, game):
+        """Scroll the chosen recipe into view one wheel step per frame, then click it"""
+        if self.recipe is None:
+            self.recipe = self.pick_recipe(game)
+        rect = game.recipe_list.visible_rect(self.recipe)
+        if rect is None:
+            above = game.recipe_list.row_rect(self.recipe).y < game.recipe_list.viewport.y
+            return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1 if above else -1)]
+        self.recipe = None
+        return [click(rect.center)]
+
+    def pick_recipe(self, game):
+        # Only recipes whose ingredients are all on the grid can be finished
+        ids = {ingredient.id for ingredient in game.ingredients}
+        playable = [i for i, recipe in enumerate(game.recipes)
+                    if recipe.ingredient_ids <= ids]
+        if self.mode == "random":
+            index = self.rng.choice(playable)
+        else:
+            index = playable[self.next_recipe % len(playable)]
+            self.next_recipe += 1
+        self.mix_angle = 0.0
+        self.serve_step = 0
+        return index
+
+    def pick_ingredient(self, game):
+        if self.mistake():
+            choices = game.ingredients
+        else:
+            choices = [ingredient for ingredient in game.ingredients
+                       if ingredient.id in game.current_recipe.ingredient_ids
+                       and ingredient.id not in game.selected_ids]
+        ingredient = self.rng.choice(choices) if self.mode == "random" else choices[0]
+        return game.ingredient_grid.rect_for(ingredient).center
+
+    def stir(self, mixing_game):
+        events = []
+        if self.mix_angle == 0.0:
+            events.append(click(mixing_game.center))
+        # Move clockwise around the bowl in 30 degree steps
+        self.mix_angle += 30
+        radians = math.radians(self.mix_angle)
+        pos = (int(mixing_game.center[0] + 80 * math.cos(radians)),
+               int(mixing_game.center[1] + 80 * math.sin(radians)))
+        events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0)))
+        return events
+
+    def serve(self, serving_game):
+        self.serve_step += 1
+        if self.serve_step == 1:
+            return [click(serving_game.food_rect.center)]
+        if self.serve_step == 2:
+            return [pygame.event.Event(pygame.MOUSEMOTION, pos=serving_game.plate_rect.center,
+                                       rel=(0, 0), buttons=(1, 0, 0))]
+        self.serve_step = 0
+        return [click(serving_game.plate_rect.center, pygame.MOUSEBUTTONUP)]
+
+
+def click(pos, event_type=pygame.MOUSEBUTTONDOWN):
+    return pygame.event.Event(event_type, pos=pos, button=1)
+
+
+def game_stage(game):
+    """Name the screen the game is on; cooking stages are states of their own"""
+    return game.game_state.current_state
+
+
+def run_headless(games=100, bot=None, draw=True, max_frames_per_game=10000, seed=None):
+    """Play full cook cycles as fast as possible and return timing statistics"""
+    game = TeluguCookingGame(seed=seed)
+    bot = bot or CookBot()
+    stage_times = {stage: [] for stage in STAGES}
+    stage_frames = {stage: [] for stage in STAGES}
+    completed = 0
+    stalled = 0
+
+    start = time.perf_counter()
+    for _ in range(games):
+        score = game.score
+        frames = 0
+        stage = game_stage(game)
+        stage_start = time.perf_counter()
+        stage_frame = 0
+        while game.score == score and frames < max_frames_per_game:
+            for event in bot.events_for(game):
+                game.handle_event(event)
+            game.update()
+            if draw:
+                game.present()
+            frames += 1
+            stage_frame += 1
+
+            new_stage = game_stage(game)
+            if new_stage != stage:
+                stage_times[stage].append(time.perf_counter() - stage_start)
+                stage_frames[stage].append(stage_frame)
+                stage = new_stage
+                stage_start = time.perf_counter()
+                stage_frame = 0
+        if game.score == score:
+            stalled += 1
+            # Start the next game from a clean recipe selection
+            game.game_state.set_state("recipe_selection")
+        else:
+            completed += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "completed": completed,
+        "stalled": stalled,
+        "seconds": elapsed,
+        "games_per_second": completed / elapsed if elapsed else 0.0,
+        "stages": {stage: summarize(stage_times[stage], stage_frames[stage])
+                   for stage in STAGES if stage_times[stage]},
+    }
+
+
+def summarize(times, frames):
+    times = sorted(times)
+    return {
+        "count": len(times),
+        "mean_ms": 1000 * sum(times) / len(times),
+        "p95_ms": 1000 * times[min(len(times) - 1, int(len(times) * 0.95))],
+        "mean_frames": sum(frames) / len(frames),
+    }
+
+
+def print_report(report):
+    print(f"Games: {report['completed']}/{report['games']} completed, {report['stalled']} stalled")
+    print(f"Time: {report['seconds']:.2f}s ({report['games_per_second']:.1f} games/s)")
+    print(f"{'stage':<18}{'count':>8}{'mean ms':>10}{'p95 ms':>10}{'frames':>9}")
+    for stage, stats in report["stages"].items():
+        print(f"{stage:<18}{stats['count']:>8}{stats['mean_ms']:>10.3f}"
+              f"{stats['p95_ms']:>10.3f}{stats['mean_frames']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless bot-driven soak test")
+    parser.add_argument("--games", type=int, default=100, help="number of full cook cycles")
+    parser.add_argument("--bot", choices=["scripted", "random"], default="scripted")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the game and the random bot")
+    parser.add_argument("--no-draw", action="store_true", help="skip rendering entirely")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = run_headless(args.games, CookBot(args.bot, args.seed), draw=not args.no_draw, seed=args.seed)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
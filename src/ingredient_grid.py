@@ -0,0 +1,49 @@
+import pygame
+
+
+class IngredientGrid:
+    """Precomputed layout of the ingredient selection grid.
+
+    Rects are computed once; a click is mapped to its grid cell arithmetically,
+    so hit-testing is O(1) however many ingredients there are. draw() and
+    handle_event() share the same rects.
+    """
+
+    def __init__(self, ingredients, origin=(100, 150), columns=5, spacing=(100, 100), cell_size=(64, 64)):
+        self.ingredients = list(ingredients)
+        self.origin = origin
+        self.columns = columns
+        self.spacing = spacing
+        self.cell_size = cell_size
+        self.rects = []
+        for idx in range(len(self.ingredients)):
+            x = origin[0] + (idx % columns) * spacing[0]
+            y = origin[1] + (idx // columns) * spacing[1]
+            self.rects.append(pygame.Rect((x, y), cell_size))
+        # Look up an ingredient's rect without scanning the list
+        self.rect_by_name = {ingredient.name: rect for ingredient, rect in zip(self.ingredients, self.rects)}
+
+    def __iter__(self):
+        """Yield (ingredient, rect) pairs in grid order"""
+        return zip(self.ingredients, self.rects)
+
+    def ingredient_at(self, pos):
+        """Return the ingredient under pos, or None"""
+        col = (pos[0] - self.origin[0]) // self.spacing[0]
+        row = (pos[1] - self.origin[1]) // self.spacing[1]
+        if col < 0 or col >= self.columns or row < 0:
+            return None
+        idx = row * self.columns + col
+        if idx >= len(self.ingredients):
+            return None
+        # Only the image itself is clickable, not the gap around it
+        if not self.rects[idx].collidepoint(pos):
+            return None
+        return self.ingredients[idx]
+
+    def visible(self, area):
+        """Return the ingredients whose cells overlap area (e.g. the screen)"""
+        return [ingredient for ingredient, rect in self if rect.colliderect(area)]
+
+    def rect_for(self, ingredient):
+        return self.rect_by_name[ingredient.name]
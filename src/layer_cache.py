@@ -0,0 +1,68 @@
+from collections import OrderedDict
+import pygame
+
+# Colour treated as transparent in overlay layers
+TRANSPARENT = (255, 0, 255)
+# Layers drawn in the same frame (the static layer and the help overlay)
+# that the byte budget always leaves in place
+MIN_LAYERS = 2
+
+
+class LayerCache:
+    """Prerendered screen layers keyed by everything they depend on.
+
+    A layer is rendered once by render(surface) into a surface with the
+    display's pixel format and reused for as long as its key stays the same.
+    A changed key (another recipe, a new score, a new selection) simply
+    renders a new layer; the least recently used ones are dropped once
+    there are more than max_layers or they take more than max_bytes, since
+    every layer is a full screen of pixels at whatever resolution it is for.
+    """
+
+    def __init__(self, size, max_layers=8, max_bytes=64 * 1024 * 1024):
+        self.size = size
+        self.max_layers = max_layers
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.layers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render, overlay=False, size=None):
+        """Return the layer for key, calling render(surface) on a miss.
+
+        Overlay layers start out transparent and are blitted through a
+        colour key, so only what render() drew covers the screen. Layers
+        for another screen size than the cache's default pass size, and
+        must include it in their key.
+        """
+        layer = self.layers.get(key)
+        if layer is not None:
+            self.layers.move_to_end(key)
+            self.hits += 1
+            return layer
+
+        self.misses += 1
+        layer = pygame.Surface(size or self.size)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        if overlay:
+            layer.fill(TRANSPARENT)
+        render(layer)
+        if overlay:
+            layer.set_colorkey(TRANSPARENT, pygame.RLEACCEL)
+        self.layers[key] = layer
+        self.total_bytes += layer.get_pitch() * layer.get_height()
+        self.evict()
+        return layer
+
+    def evict(self):
+        """Drop least recently used layers until both limits are met"""
+        while len(self.layers) > self.max_layers or (len(self.layers) > MIN_LAYERS
+                                                     and self.total_bytes > self.max_bytes):
+            _, layer = self.layers.popitem(last=False)
+            self.total_bytes -= layer.get_pitch() * layer.get_height()
+
+    def clear(self):
+        self.layers.clear()
+        self.total_bytes = 0
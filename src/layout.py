@@ -0,0 +1,43 @@
+import pygame
+
+# Every position and size in the game is given in pixels of this screen size
+DESIGN_SIZE = (800, 700)
+
+
+class Layout:
+    """Widget rects for one screen size, computed from anchors.
+
+    A widget is described as (anchor, offset, size) in design pixels. The
+    anchor names a point of the screen the same way pygame.Rect names its
+    points ("topleft", "midtop", "center", "bottomright", ...); the widget
+    is placed at that point plus the offset, aligned on its own point of
+    the same name. Offsets and sizes are scaled uniformly so the design
+    fits the screen, so a widget anchored "midtop" stays centred and one
+    anchored "topright" stays at the right edge on any aspect ratio.
+
+    Rects are computed once per screen size and shared by hit-testing and
+    drawing; a resize simply builds a new Layout.
+    """
+
+    def __init__(self, size=DESIGN_SIZE):
+        self.size = tuple(size)
+        self.rect = pygame.Rect((0, 0), self.size)
+        self.scale = min(self.size[0] / DESIGN_SIZE[0], self.size[1] / DESIGN_SIZE[1])
+
+    def scaled(self, value):
+        """Convert a length in design pixels to screen pixels"""
+        return round(value * self.scale)
+
+    def point(self, anchor, offset=(0, 0)):
+        """Screen position of an anchor point moved by offset design pixels"""
+        x, y = getattr(self.rect, anchor)
+        return (x + self.scaled(offset[0]), y + self.scaled(offset[1]))
+
+    def place(self, anchor, offset, size):
+        rect = pygame.Rect((0, 0), (self.scaled(size[0]), self.scaled(size[1])))
+        setattr(rect, anchor, self.point(anchor, offset))
+        return rect
+
+    def rects(self, widgets):
+        """Place a table of name -> (anchor, offset, size); returns name -> Rect"""
+        return {name: self.place(*spec) for name, spec in widgets.items()}
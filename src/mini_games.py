@@ -1,14 +1,56 @@
+from array import array
+from math import atan2, pi, radians, tau
 import pygame
 import random
+from font_registry import font_registry
+from text_cache import text_cache
+from layout import Layout
+
+# Widgets of each mini-game: name -> (anchor, offset, size) in design pixels,
+# see layout.Layout. Zero-sized entries are text positions.
+CHOPPING_WIDGETS = {
+    "left": ("midtop", (-150, 200), (100, 100)),
+    "middle": ("midtop", (0, 200), (100, 100)),
+    "right": ("midtop", (150, 200), (100, 100)),
+    "progress": ("midtop", (-50, 350), (0, 0)),
+}
+MIXING_WIDGETS = {
+    "bowl": ("midtop", (0, 200), (200, 200)),
+    "progress": ("midtop", (-50, 450), (0, 0)),
+}
+SERVING_WIDGETS = {
+    "plate": ("midtop", (0, 400), (200, 50)),
+    "pot": ("midtop", (0, 150), (200, 100)),
+    "food": ("midtop", (0, 175), (100, 50)),
+    "time": ("topright", (0, 100), (150, 40)),
+}
 
 class MiniGame:
-    def __init__(self):
+    # Mini-games with timers need update() every frame; the others only
+    # change on input and let the game loop sleep
+    needs_timed_updates = False
+    
+    def __init__(self, font=None, rng=None, layout=None):
         self.completed = False
+        self.custom_font = font
+        self.layout = layout or Layout()
+        # Fonts come from the shared registry so draw() never opens one
+        self.font = font or font_registry.get(None, self.layout.scaled(36))
+        # Pass a seeded random.Random to make the mini-game reproducible
+        self.rng = rng or random
+        # Screen regions changed since the renderer last asked
+        self.dirty_rects = []
+    
+    def place(self, layout):
+        """Compute the mini-game's rects for a layout; called again on resize"""
+        self.layout = layout
+        self.font = self.custom_font or font_registry.get(None, layout.scaled(36))
     
     def handle_event(self, event):
         pass
     
-    def update(self):
+    def update(self, dt):
+        """Advance timers by dt seconds of game time"""
         pass
     
     def draw(self, screen):
@@ -16,36 +58,62 @@ class MiniGame:
     
     def is_completed(self):
         return self.completed
+    
+    def mark_dirty(self, *rects):
+        """Report regions that need to be redrawn on the next frame"""
+        self.dirty_rects.extend(pygame.Rect(rect) for rect in rects)
+    
+    def consume_dirty_rects(self):
+        """Return and clear the regions changed since the last call"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
 
 class ChoppingGame(MiniGame):
-    def __init__(self):
-        super().__init__()
+    needs_timed_updates = True
+    
+    def __init__(self, font=None, rng=None, layout=None):
+        super().__init__(font, rng, layout)
         self.chop_count = 0
         self.required_chops = 10
-        self.chop_areas = [
-            pygame.Rect(200, 200, 100, 100),
-            pygame.Rect(350, 200, 100, 100),
-            pygame.Rect(500, 200, 100, 100)
-        ]
-        self.active_area = random.choice(self.chop_areas)
-        self.timer = 0
+        self.active_area = None
+        self.place(self.layout)
+        self.active_area = self.rng.choice(self.chop_areas)
+        self.timer = 0.0
+        self.swap_interval = 1.0  # Seconds before the active area moves
+    
+    def place(self, layout):
+        super().place(layout)
+        # The active area keeps its position in the row across a resize
+        active = self.chop_areas.index(self.active_area) if self.active_area is not None else None
+        rects = layout.rects(CHOPPING_WIDGETS)
+        self.chop_areas = [rects["left"], rects["middle"], rects["right"]]
+        if active is not None:
+            self.active_area = self.chop_areas[active]
+        self.progress_pos = rects["progress"].topleft
+        # Area covered by the progress text at its widest
+        self.progress_rect = pygame.Rect(self.progress_pos, self.font.size(f"{self.required_chops}/{self.required_chops}")).inflate(10, 0)
+    
+    def set_active_area(self, area):
+        self.mark_dirty(self.active_area, area)
+        self.active_area = area
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.active_area.collidepoint(event.pos):
                 self.chop_count += 1
-                self.active_area = random.choice(self.chop_areas)
+                self.mark_dirty(self.progress_rect)
+                self.set_active_area(self.rng.choice(self.chop_areas))
                 if self.chop_count >= self.required_chops:
                     self.completed = True
-                    print("Chopping completed!")  # Debug message
                     return "completed"
         return None
     
-    def update(self):
-        self.timer += 1
-        if self.timer > 60:  # Change active area every second
-            self.active_area = random.choice(self.chop_areas)
-            self.timer = 0
+    def update(self, dt):
+        self.timer += dt
+        if self.timer > self.swap_interval:  # Change active area every second
+            self.set_active_area(self.rng.choice(self.chop_areas))
+            self.timer = 0.0
     
     def draw(self, screen):
         # Create a semi-transparent overlay for text area to prevent overlapping
@@ -53,19 +121,14 @@ class ChoppingGame(MiniGame):
        # text_overlay.fill((255, 255, 255, 200))  # Semi-transparent white
         #screen.blit(text_overlay, (200, 100))
         
-        # Draw instructions
-        font = pygame.font.SysFont(None, 36)
-        instructions = font.render("", True, (0, 0, 0))
-        screen.blit(instructions, (300, 100))
-        
         # Create overlay for progress text
         #progress_overlay = pygame.Surface((100, 40), pygame.SRCALPHA)
        # progress_overlay.fill((255, 255, 255, 200))
         #screen.blit(progress_overlay, (350, 350))
         
         # Draw progress
-        progress = font.render(f"{self.chop_count}/{self.required_chops}", True, (0, 0, 0))
-        screen.blit(progress, (350, 350))
+        progress = text_cache.render(self.font, f"{self.chop_count}/{self.required_chops}", True, (0, 0, 0))
+        screen.blit(progress, self.progress_pos)
         
         # Draw chopping areas
         for area in self.chop_areas:
@@ -73,47 +136,95 @@ class ChoppingGame(MiniGame):
             pygame.draw.rect(screen, color, area)
 
 class MixingGame(MiniGame):
-    def __init__(self):
-        super().__init__()
+    # Motion samples kept between updates; a full buffer is processed early
+    stroke_capacity = 256
+    # Degrees the spoon has to travel around the bowl for one mix
+    degrees_per_mix = 30
+    
+    def __init__(self, font=None, rng=None, layout=None):
+        super().__init__(font, rng, layout)
         self.mix_count = 0
         self.required_mixes = 15
         self.mix_direction = "clockwise"
-        self.last_pos = None
-        self.bowl_rect = pygame.Rect(300, 200, 200, 200)
-        self.center = (400, 300)
+        # Travel in the mixing direction not yet counted as a mix, in radians
+        self.mix_travel = 0.0
+        # Pending stroke points as interleaved x, y pairs; stroke_length of them are filled
+        self.stroke = array("d", bytes(16 * self.stroke_capacity))
+        self.place(self.layout)
+    
+    def place(self, layout):
+        super().place(layout)
+        rects = layout.rects(MIXING_WIDGETS)
+        self.bowl_rect = rects["bowl"]
+        self.center = self.bowl_rect.center
+        # Angle of the last processed point of the current stroke, in radians.
+        # Points recorded before a resize are in old coordinates, so the
+        # stroke starts over.
         self.last_angle = None
+        self.stroke_length = 0
+        self.progress_pos = rects["progress"].topleft
+        # Area covered by the progress text at its widest
+        self.progress_rect = pygame.Rect(self.progress_pos, self.font.size(f"{self.required_mixes}/{self.required_mixes}")).inflate(10, 0)
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION and pygame.mouse.get_pressed()[0]:
-            pos = pygame.mouse.get_pos()
-            
-            if self.bowl_rect.collidepoint(pos):
-                if self.last_pos:
-                    # Calculate angle from center
-                    dx1, dy1 = self.last_pos[0] - self.center[0], self.last_pos[1] - self.center[1]
-                    dx2, dy2 = pos[0] - self.center[0], pos[1] - self.center[1]
-                    
-                    # Calculate angles
-                    angle1 = pygame.math.Vector2(dx1, dy1).angle_to((1, 0))
-                    angle2 = pygame.math.Vector2(dx2, dy2).angle_to((1, 0))
-                    
-                    # Check if we've moved enough
-                    if abs(angle2 - angle1) > 10:
-                        # Check direction
-                        if self.mix_direction == "clockwise" and angle2 < angle1:
-                            self.mix_count += 1
-                        elif self.mix_direction == "counterclockwise" and angle2 > angle1:
-                            self.mix_count += 1
-                        
-                        if self.mix_count >= self.required_mixes:
-                            self.completed = True
-                            return "completed"
-                
-                self.last_pos = pos
+        # Use the event's own position and buttons so synthesized input works too
+        if event.type == pygame.MOUSEMOTION and event.buttons[0]:
+            if self.bowl_rect.collidepoint(event.pos):
+                # Only record the point; the stroke is measured once per frame
+                if self.stroke_length == self.stroke_capacity:
+                    result = self.process_stroke()
+                    if result:
+                        return result
+                end = 2 * self.stroke_length
+                self.stroke[end] = event.pos[0]
+                self.stroke[end + 1] = event.pos[1]
+                self.stroke_length += 1
         
         if event.type == pygame.MOUSEBUTTONUP:
-            self.last_pos = None
+            result = self.process_stroke()
+            # The next stroke starts wherever the button goes down again
+            self.last_angle = None
+            return result
+        
+        return None
+    
+    def update(self, dt):
+        return self.process_stroke()
+    
+    def process_stroke(self):
+        """Count the mixes made by all points recorded since the last call"""
+        if not self.stroke_length or self.completed:
+            self.stroke_length = 0
+            return None
+        
+        points = self.stroke[:2 * self.stroke_length]
+        self.stroke_length = 0
+        
+        cx, cy = self.center
+        # Screen y points down, so clockwise motion increases the angle
+        angles = list(map(atan2, [y - cy for y in points[1::2]], [x - cx for x in points[0::2]]))
+        previous = angles[:-1]
+        if self.last_angle is not None:
+            previous.insert(0, self.last_angle)
+        else:
+            angles = angles[1:]
+        self.last_angle = angles[-1] if angles else atan2(points[1] - cy, points[0] - cx)
         
+        # Sum the angle steps, each unwrapped to (-pi, pi], for the net winding
+        winding = sum((a - b + pi) % tau - pi for a, b in zip(angles, previous))
+        if self.mix_direction == "counterclockwise":
+            winding = -winding
+        # Going the wrong way undoes travel, so wiggling back and forth never counts
+        self.mix_travel = max(0.0, self.mix_travel + winding)
+        mixes, self.mix_travel = divmod(self.mix_travel, radians(self.degrees_per_mix))
+        if not mixes:
+            return None
+        
+        self.mix_count = min(self.required_mixes, self.mix_count + int(mixes))
+        self.mark_dirty(self.progress_rect)
+        if self.mix_count >= self.required_mixes:
+            self.completed = True
+            return "completed"
         return None
     
     def draw(self, screen):
@@ -122,34 +233,38 @@ class MixingGame(MiniGame):
        # text_overlay.fill((255, 255, 255, 200))  # Semi-transparent white
         #screen.blit(text_overlay, (200, 100))
         
-        # Draw instructions
-        font = pygame.font.SysFont(None, 36)
-        instructions = font.render("", True, (0, 0, 0))
-        screen.blit(instructions, (300, 100))
-        
         # Create overlay for progress text
         #progress_overlay = pygame.Surface((100, 40), pygame.SRCALPHA)
         #progress_overlay.fill((255, 255, 255, 200))
         #screen.blit(progress_overlay, (350, 450))
         
         # Draw progress
-        progress = font.render(f"{self.mix_count}/{self.required_mixes}", True, (0, 0, 0))
-        screen.blit(progress, (350, 450))
+        progress = text_cache.render(self.font, f"{self.mix_count}/{self.required_mixes}", True, (0, 0, 0))
+        screen.blit(progress, self.progress_pos)
         
         # Draw bowl
         pygame.draw.ellipse(screen, (200, 200, 200), self.bowl_rect)
-        pygame.draw.ellipse(screen, (150, 150, 150), self.bowl_rect, 5)
+        pygame.draw.ellipse(screen, (150, 150, 150), self.bowl_rect, max(1, self.layout.scaled(5)))
 
 class ServingGame(MiniGame):
-    def __init__(self):
-        super().__init__()
-        self.plate_rect = pygame.Rect(300, 400, 200, 50)
-        self.pot_rect = pygame.Rect(300, 150, 200, 100)
-        self.food_rect = pygame.Rect(350, 175, 100, 50)
-        self.dragging = False
+    needs_timed_updates = True
+    
+    def __init__(self, font=None, rng=None, layout=None):
+        super().__init__(font, rng, layout)
         self.served = False
-        self.time_limit = 10 * 60  # 10 seconds at 60 FPS
-        self.timer = 0
+        self.time_limit = 10.0  # Seconds
+        self.timer = 0.0
+        self.place(self.layout)
+    
+    def place(self, layout):
+        super().place(layout)
+        rects = layout.rects(SERVING_WIDGETS)
+        self.plate_rect = rects["plate"]
+        self.pot_rect = rects["pot"]
+        # Food being dragged when the screen is resized goes back in the pot
+        self.food_rect = rects["food"]
+        self.dragging = False
+        self.time_rect = rects["time"]
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -158,19 +273,30 @@ class ServingGame(MiniGame):
         
         elif event.type == pygame.MOUSEMOTION:
             if self.dragging:
+                old_rect = self.food_rect.copy()
                 self.food_rect.center = event.pos
+                self.mark_dirty(old_rect, self.food_rect)
         
         elif event.type == pygame.MOUSEBUTTONUP:
             self.dragging = False
             if self.plate_rect.contains(self.food_rect):
                 self.served = True
+                self.mark_dirty(self.food_rect)
                 self.completed = True
                 return "completed"
         
         return None
     
-    def update(self):
-        self.timer += 1
+    def time_left(self):
+        """Whole seconds left, as shown on screen"""
+        return max(0, int(self.time_limit - self.timer))
+    
+    def update(self, dt):
+        shown = self.time_left()
+        self.timer += dt
+        # The countdown text only changes once per second
+        if self.time_left() != shown:
+            self.mark_dirty(self.time_rect)
         if self.timer >= self.time_limit and not self.completed:
             self.completed = True
             return "timeout"
@@ -181,27 +307,22 @@ class ServingGame(MiniGame):
         #text_overlay.fill((255, 255, 255, 200))  # Semi-transparent white
         #screen.blit(text_overlay, (200, 100))
         
-        # Draw instructions
-        font = pygame.font.SysFont(None, 36)
-        instructions = font.render("", True, (0, 0, 0))
-        screen.blit(instructions, (300, 100))
-        
         # Create overlay for time text
-        time_overlay = pygame.Surface((150, 40), pygame.SRCALPHA)
+        time_overlay = pygame.Surface(self.time_rect.size, pygame.SRCALPHA)
         time_overlay.fill((255, 255, 255, 200))
-        screen.blit(time_overlay, (650, 100))
+        screen.blit(time_overlay, self.time_rect)
         
         # Draw time remaining
-        time_left = max(0, (self.time_limit - self.timer) // 60)
-        time_text = font.render(f"Time: {time_left}s", True, (255, 0, 0) if time_left <= 3 else (0, 0, 0))
-        screen.blit(time_text, (650, 100))
+        time_left = self.time_left()
+        time_text = text_cache.render(self.font, f"Time: {time_left}s", True, (255, 0, 0) if time_left <= 3 else (0, 0, 0))
+        screen.blit(time_text, self.time_rect)
         
         # Draw pot
         pygame.draw.rect(screen, (100, 100, 100), self.pot_rect)
 
         # Draw plate
         pygame.draw.ellipse(screen, (255, 255, 255), self.plate_rect)
-        pygame.draw.ellipse(screen, (200, 200, 200), self.plate_rect, 3)
+        pygame.draw.ellipse(screen, (200, 200, 200), self.plate_rect, max(1, self.layout.scaled(3)))
         
         # Draw food
         if not self.served:
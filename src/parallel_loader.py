@@ -0,0 +1,105 @@
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+from asset_manager import asset_manager, scale_image
+
+
+class ImageJob:
+    kind = "images"
+
+    def __init__(self, path, size, alpha, fallback_color):
+        self.path = path
+        self.size = tuple(size) if size else None
+        self.alpha = alpha
+        self.fallback_color = fallback_color
+
+    def load(self):
+        """Decode and scale on a worker thread (pygame releases the GIL here)"""
+        image = pygame.image.load(self.path)
+        if self.size and image.get_size() != self.size:
+            image = scale_image(image, self.size)
+        return image
+
+    def finish(self, future):
+        """Hand the result to the asset manager; runs on the main thread"""
+        try:
+            image = future.result()
+        except (pygame.error, FileNotFoundError) as e:
+            if self.fallback_color is None:
+                print(f"Could not load image: {self.path}")
+                return
+            image = asset_manager.placeholder(self.path, self.size, self.fallback_color, e)
+        # convert()/convert_alpha() happen here, with the display available
+        asset_manager.store(self.path, self.size, image, self.alpha)
+
+
+class SoundJob:
+    kind = "sounds"
+
+    def __init__(self, path, results):
+        self.path = path
+        self.results = results
+
+    def load(self):
+        return pygame.mixer.Sound(self.path)
+
+    def finish(self, future):
+        try:
+            self.results[self.path] = future.result()
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Could not load sound: {self.path}")
+            print(f"Error: {e}")
+            self.results[self.path] = None
+
+
+class ParallelLoader:
+    """Fans asset decode and scale jobs out to a thread pool.
+
+    Decoding runs on the workers; storing and converting surfaces runs on
+    the calling (main) thread as each job completes, so the progress
+    callback can draw a splash screen between completions.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.jobs = []
+        # Loaded sounds keyed by path; None when a sound failed to load
+        self.sounds = {}
+        # Seconds spent loading each kind of job ("images", "sounds"), summed
+        # over the workers and the main thread; kinds overlap in wall time
+        self.seconds = Counter()
+
+    def add_image(self, path, size=None, alpha=False, fallback_color=None):
+        # Already cached (or in the atlas): nothing to decode
+        if not asset_manager.has_image(path, size):
+            self.jobs.append(ImageJob(path, size, alpha, fallback_color))
+
+    def add_sound(self, path):
+        self.jobs.append(SoundJob(path, self.sounds))
+
+    def run(self, progress=None):
+        """Run all queued jobs; progress(done, total) is called on this thread"""
+        jobs, self.jobs = self.jobs, []
+        total = len(jobs)
+        if progress:
+            progress(0, total)
+        if not jobs:
+            return
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {executor.submit(self.load, job): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                job = futures[future]
+                start = time.perf_counter()
+                job.finish(future)
+                self.seconds[job.kind] += job.seconds + time.perf_counter() - start
+                if progress:
+                    progress(done, total)
+
+    def load(self, job):
+        """Run a job's load on a worker; the time is added up on the main thread"""
+        start = time.perf_counter()
+        try:
+            return job.load()
+        finally:
+            job.seconds = time.perf_counter() - start
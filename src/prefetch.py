@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from asset_manager import asset_manager
+from parallel_loader import ImageJob
+
+
+class AssetPrefetcher:
+    """Decodes assets that are about to be needed on a background thread.
+
+    The game requests the backgrounds of a hovered recipe or of the next
+    cooking stage, and the ingredient images of the select screen; poll() moves finished decodes into the asset manager on
+    the main thread, and wait() finishes a pending decode instead of
+    starting a second one if a stage needs its background early.
+    """
+
+    def __init__(self, max_workers=1):
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="prefetch")
+        # (path, size) -> (future, job, owners) for decodes not yet handed
+        # over; owners are whoever requested it, e.g. sessions sharing this
+        self.pending = {}
+
+    def request(self, path, size=None, alpha=False, fallback_color=None, owner=None):
+        key = (path, tuple(size) if size else None)
+        pending = self.pending.get(key)
+        if pending:
+            pending[2].add(owner)
+            return
+        if asset_manager.has_image(path, size):
+            return
+        job = ImageJob(path, size, alpha, fallback_color)
+        self.pending[key] = (self.executor.submit(job.load), job, {owner})
+
+    def poll(self):
+        """Store finished decodes; call once per frame from the main thread"""
+        for key, (future, job, owners) in list(self.pending.items()):
+            if future.done():
+                del self.pending[key]
+                job.finish(future)
+
+    def cancel(self, owner):
+        """Withdraw everything owner requested, e.g. when its screen size changes.
+
+        A decode is only dropped once nobody else still wants it; decodes
+        that already started are left to finish and be stored.
+        """
+        for key, (future, job, owners) in list(self.pending.items()):
+            owners.discard(owner)
+            if not owners and future.cancel():
+                del self.pending[key]
+
+    def wait(self, path, size=None):
+        """Block until a pending decode of path is finished and stored"""
+        pending = self.pending.pop((path, tuple(size) if size else None), None)
+        if pending:
+            future, job, owners = pending
+            job.finish(future)
+
+    def shutdown(self):
+        # Queued decodes are cancelled by hand; shutdown(cancel_futures=True)
+        # needs Python 3.9
+        for future, job, owners in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown(wait=False)
@@ -1,5 +1,24 @@
+# Backgrounds used by the chopping and mixing stages unless a recipe overrides them
+DEFAULT_STAGE_BACKGROUNDS = {
+    "chop": "kitchen_background.png",
+    "mix": "traditional_kitchen background.png",
+}
+
+
 class Recipe:
-    def __init__(self, name, ingredients, instructions):
+    def __init__(self, name, ingredients, instructions, ingredient_ids=(),
+                 background="kitchen_background.png", stage_backgrounds=None):
         self.name = name
         self.ingredients = ingredients
         self.instructions = instructions
+        # Interned ingredient IDs so membership checks are set lookups
+        self.ingredient_ids = frozenset(ingredient_ids)
+        # Background image files, declared in the recipe data
+        self.background = background
+        self.stage_backgrounds = stage_backgrounds or {}
+    
+    def background_for(self, stage):
+        """Return the background image file for a cooking stage"""
+        return (self.stage_backgrounds.get(stage)
+                or DEFAULT_STAGE_BACKGROUNDS.get(stage)
+                or self.background)
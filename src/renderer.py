@@ -0,0 +1,70 @@
+import pygame
+
+# Window events after which the whole display must be repainted
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+# Events whose positions depend on the current layout
+INPUT_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+                pygame.KEYDOWN, pygame.KEYUP)
+
+
+class DirtyRenderer:
+    """Presents only the parts of the screen that changed since the last frame.
+
+    The game describes its static content with a scene key (state, stage,
+    selection, score, ...). While the key stays the same nothing is redrawn;
+    widgets that animate, such as the mini-games, report their own changed
+    regions with invalidate().
+
+    With update_display off it only redraws the surface, for offscreen
+    sessions whose owner ships the changed regions elsewhere.
+    """
+
+    def __init__(self, screen, update_display=True):
+        self.screen = screen
+        self.update_display = update_display
+        self.screen_rect = screen.get_rect()
+        self.scene_key = None
+        self.full_redraw = True
+        self.dirty_rects = []
+
+    def set_scene(self, key):
+        """Repaint everything when the static part of the screen changes"""
+        if key != self.scene_key:
+            self.scene_key = key
+            self.invalidate()
+
+    def invalidate(self, rect=None):
+        """Mark a region as changed, or the whole screen when rect is None"""
+        if rect is None:
+            self.full_redraw = True
+        else:
+            rect = pygame.Rect(rect).clip(self.screen_rect)
+            if rect.width and rect.height:
+                self.dirty_rects.append(rect)
+
+    def has_changes(self):
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def present(self, draw_func):
+        """Redraw the changed area with draw_func and push it to the display.
+
+        Returns the list of rects that changed (empty if nothing did).
+        """
+        if self.full_redraw:
+            draw_func()
+            changed = [self.screen_rect.copy()]
+        elif self.dirty_rects:
+            # Blits outside the dirty area are clipped away, so only the
+            # changed widgets cost any fill or blit work
+            area = self.dirty_rects[0].unionall(self.dirty_rects[1:])
+            self.screen.set_clip(area)
+            draw_func()
+            self.screen.set_clip(None)
+            changed = self.dirty_rects
+        else:
+            changed = []
+        if changed and self.update_display:
+            pygame.display.update(changed)
+        self.full_redraw = False
+        self.dirty_rects = []
+        return changed
@@ -0,0 +1,209 @@
+"""Record game sessions to a compact binary log and play them back.
+
+A replay holds the session's random seed, then one record per frame with
+its frame index, timestamp and frame time, followed by the events handled
+in that frame. Playback feeds the same events and frame times through
+TeluguCookingGame.step_frame, so the session is reproduced exactly.
+
+Usage:
+    python src/main.py --record session.replay
+    python src/replay.py session.replay [more.replay ...] [--realtime] [--no-draw]
+
+Without --realtime the replays run headless as fast as possible, which
+makes a directory of recorded sessions usable as a throughput benchmark.
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+
+import pygame
+
+MAGIC = b"TCGR"
+VERSION = 2
+# Version 2 added window resizes; older files simply never contain one
+READABLE_VERSIONS = (1, 2)
+
+HEADER = struct.Struct("<4sHQ")  # magic, version, seed
+FRAME = struct.Struct("<cIdd")  # b"F", frame index, timestamp, frame time
+EVENT = struct.Struct("<cH")  # b"E", event type, then the type's payload
+END = struct.Struct("<ci")  # b"X", final score
+
+# Attributes stored for each event type; anything else is stored as a bare type
+EVENT_PAYLOADS = {
+    pygame.MOUSEMOTION: (struct.Struct("<hhhhBBB"), ("pos", 2), ("rel", 2), ("buttons", 3)),
+    pygame.MOUSEBUTTONDOWN: (struct.Struct("<hhB"), ("pos", 2), ("button", 1)),
+    pygame.MOUSEBUTTONUP: (struct.Struct("<hhB"), ("pos", 2), ("button", 1)),
+    pygame.MOUSEWHEEL: (struct.Struct("<hh"), ("x", 1), ("y", 1)),
+    pygame.KEYDOWN: (struct.Struct("<iH"), ("key", 1), ("mod", 1)),
+    pygame.KEYUP: (struct.Struct("<iH"), ("key", 1), ("mod", 1)),
+    # The layout, and so every hit-test after it, depends on the window size
+    pygame.VIDEORESIZE: (struct.Struct("<HH"), ("size", 2)),
+}
+
+
+class ReplayError(ValueError):
+    """Raised when a file is not a replay this version can read"""
+
+
+def encode_event(event):
+    payload = EVENT_PAYLOADS.get(event.type)
+    data = EVENT.pack(b"E", event.type)
+    if payload is None:
+        return data
+    values = []
+    for name, size in payload[1:]:
+        value = getattr(event, name)
+        values.extend(value if size > 1 else (value,))
+    return data + payload[0].pack(*values)
+
+
+def decode_event(event_type, data, offset):
+    """Return the event stored at offset and the offset after it"""
+    payload = EVENT_PAYLOADS.get(event_type)
+    if payload is None:
+        return pygame.event.Event(event_type), offset
+    values = payload[0].unpack_from(data, offset)
+    attributes = {}
+    i = 0
+    for name, size in payload[1:]:
+        attributes[name] = tuple(values[i:i + size]) if size > 1 else values[i]
+        i += size
+    return pygame.event.Event(event_type, attributes), offset + payload[0].size
+
+
+class ReplayRecorder:
+    """Appends every frame of a running session to a replay file"""
+
+    def __init__(self, path, seed):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+        self.frame_index = 0
+        self.start = time.perf_counter()
+
+    def record_frame(self, frame_time, events):
+        chunks = [FRAME.pack(b"F", self.frame_index, time.perf_counter() - self.start, frame_time)]
+        chunks.extend(encode_event(event) for event in events)
+        self.file.write(b"".join(chunks))
+        self.frame_index += 1
+
+    def close(self, score):
+        self.file.write(END.pack(b"X", score))
+        self.file.close()
+
+
+class Replay:
+    """A replay file read into memory"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = f.read()
+        if len(self.data) < HEADER.size:
+            raise ReplayError(f"Not a replay file: {path}")
+        magic, version, self.seed = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version not in READABLE_VERSIONS:
+            raise ReplayError(f"Not a replay file this version can read: {path}")
+        self.path = path
+        # Score when recording stopped; None if the session did not exit cleanly
+        self.final_score = None
+
+    def frames(self):
+        """Yield (frame index, timestamp, frame time, events) for each frame"""
+        data = self.data
+        offset = HEADER.size
+        frame = None
+        try:
+            while offset < len(data):
+                tag = data[offset:offset + 1]
+                if tag == b"F":
+                    if frame:
+                        yield frame
+                    index, timestamp, frame_time = FRAME.unpack_from(data, offset)[1:]
+                    frame = (index, timestamp, frame_time, [])
+                    offset += FRAME.size
+                elif tag == b"E" and frame:
+                    event_type = EVENT.unpack_from(data, offset)[1]
+                    event, offset = decode_event(event_type, data, offset + EVENT.size)
+                    frame[3].append(event)
+                elif tag == b"X":
+                    self.final_score = END.unpack_from(data, offset)[1]
+                    break
+                else:
+                    raise ReplayError(f"Corrupt record at byte {offset} of {self.path}")
+        except struct.error:
+            # A session that crashed can leave a partly written last record
+            frame = None
+        if frame:
+            yield frame
+
+
+def play_replay(path, realtime=False, draw=True):
+    """Play a replay through a fresh game and return timing and score"""
+    from main import TeluguCookingGame
+
+    replay = Replay(path)
+    game = TeluguCookingGame(fps=0, seed=replay.seed)
+    frames = events = 0
+    start = time.perf_counter()
+    for index, timestamp, frame_time, frame_events in replay.frames():
+        if realtime:
+            delay = timestamp - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            # Keep the window responsive; live input is not part of the replay
+            pygame.event.pump()
+        # Decided from the game state, exactly as the live loop does
+        animating = game.needs_timed_updates()
+        running = game.step_frame(frame_events, frame_time, animating, draw)
+        frames += 1
+        events += len(frame_events)
+        if not running:
+            break
+    elapsed = time.perf_counter() - start
+    game.resources.shutdown()
+    return {
+        "path": path,
+        "frames": frames,
+        "events": events,
+        "seconds": elapsed,
+        "score": game.score,
+        "expected_score": replay.final_score,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back recorded game sessions")
+    parser.add_argument("paths", nargs="+", help="replay files recorded with main.py --record")
+    parser.add_argument("--realtime", action="store_true", help="play in a window at the recorded speed")
+    parser.add_argument("--no-draw", action="store_true", help="skip rendering entirely")
+    args = parser.parse_args()
+
+    if not args.realtime:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    total_frames = total_seconds = 0
+    mismatches = 0
+    for path in args.paths:
+        result = play_replay(path, args.realtime, not args.no_draw)
+        total_frames += result["frames"]
+        total_seconds += result["seconds"]
+        status = "ok"
+        if result["expected_score"] is None:
+            status = "no final score recorded"
+        elif result["score"] != result["expected_score"]:
+            status = f"MISMATCH, recorded score {result['expected_score']}"
+            mismatches += 1
+        print(f"{path}: {result['frames']} frames, {result['events']} events in "
+              f"{result['seconds']:.2f}s, score {result['score']} ({status})")
+
+    if len(args.paths) > 1 and total_seconds:
+        print(f"Total: {total_frames} frames in {total_seconds:.2f}s "
+              f"({total_frames / total_seconds:.0f} frames/s)")
+    pygame.quit()
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import pygame
+
+
+class LoopScheduler:
+    """Decides each frame whether to tick at a fixed rate or sleep until input.
+
+    Screens that only change on input (menu, recipe selection, ingredient
+    selection, mixing) block in pygame.event.wait so the process does not
+    keep a core busy. Screens with frame-counting timers tick at a fixed FPS.
+    """
+
+    def __init__(self, clock, fps, idle_timeout=1000):
+        self.clock = clock
+        self.fps = fps
+        # Milliseconds to sleep at most while idle
+        self.idle_timeout = idle_timeout
+
+    def wait_for_events(self, animating):
+        """Return the events for the next frame"""
+        if animating:
+            self.clock.tick(self.fps)
+            return pygame.event.get()
+
+        # Sleep until something happens, then drain the rest of the queue
+        event = pygame.event.wait(self.idle_timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        # Keep the clock in step so the next fixed-rate tick does not see
+        # the idle time as one huge frame
+        self.clock.tick()
+        return events
@@ -0,0 +1,664 @@
+import os
+import random
+from collections import OrderedDict
+from functools import partial
+import pygame
+from game_state import GameState, State
+from catalog import load_catalog
+from ingredient import Ingredient
+from ingredient_grid import IngredientGrid
+from mini_games import ChoppingGame, MixingGame, ServingGame
+from asset_manager import asset_manager, images_dir
+from text_cache import text_cache
+from font_registry import font_registry, TELUGU_FONT_NAMES
+from renderer import DirtyRenderer, EXPOSE_EVENTS, INPUT_EVENTS
+from layer_cache import LayerCache
+from layout import Layout
+from virtual_list import VirtualList
+from prefetch import AssetPrefetcher
+from frame_profiler import NullProfiler
+from game_clock import GameClock
+from audio import audio
+
+# Game constants; the screen size is only the default, see layout.Layout
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 700
+SIMULATION_STEP = 1 / 60  # Seconds of game time per update, independent of FPS
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+ORANGE = (255, 165, 0)
+BLUE = (100, 100, 200)
+
+# Background shown on the menu and recipe selection screens
+MENU_BACKGROUND = "kitchen_background.png"
+# Placeholder colours used if a background cannot be loaded
+BACKGROUND_COLORS = {
+    "kitchen_background.png": (220, 220, 200),  # Default kitchen color
+    "traditional_kitchen background.png": (200, 180, 140),  # Tan color for traditional kitchen
+    "modern_kitchen_background.png": (180, 200, 220),  # Light blue for modern kitchen
+}
+DEFAULT_BACKGROUND_COLOR = (220, 220, 200)  # Light tan color
+
+# Cooking stages played as mini-games: (mini-game class, title, next button label)
+MINI_GAME_STAGES = {
+    "chop": (ChoppingGame, "కోయండి - Chopping", "తరువాత - Next"),
+    "mix": (MixingGame, "కలపండి - Mixing", "తరువాత - Next"),
+    "serve": (ServingGame, "వడ్డించండి - Serving", "ముగించు - Finish"),
+}
+# Points scored for completing a stage
+STAGE_POINTS = {"serve": 100}
+
+# Screen widgets: name -> (anchor, offset, size) in design pixels, see
+# layout.Layout. Zero-sized entries are text positions.
+SCREEN_WIDGETS = {
+    "start_button": ("midtop", (0, 400), (200, 50)),
+    "next_button": ("topright", (-50, 500), (150, 50)),
+    "help_button": ("topright", (-20, 550), (80, 30)),
+    "close_help": ("topright", (-10, 20), (20, 20)),
+    "help_panel": ("center", (0, 0), (600, 500)),
+    "menu_title": ("midtop", (0, 100), (0, 0)),
+    "recipe_title": ("midtop", (0, 50), (0, 0)),
+    # Five recipe rows fit; longer menus scroll
+    "recipe_list": ("midtop", (0, 150), (400, 480)),
+    "score": ("topright", (-20, 20), (0, 0)),
+    "recipe_name": ("topleft", (20, 20), (0, 0)),
+    "instructions": ("topleft", (20, 60), (0, 0)),
+    "stage_title": ("midtop", (0, 100), (0, 0)),
+}
+# Height of a recipe button, and the distance from one to the next
+RECIPE_ROW_HEIGHT = 80
+RECIPE_ROW_SPACING = 100
+# First cell of the ingredient grid, and the distance between cells
+INGREDIENT_CELL = ("midtop", (-268, 150), (64, 64))
+INGREDIENT_SPACING = (100, 100)
+INGREDIENT_COLUMNS = 5
+# Screen sizes whose ingredient grid is kept; sessions rarely use more than one
+MAX_GRID_SIZES = 4
+# Full-screen images the asset cache must hold at once: the current and
+# next stage backgrounds, the menu background and one being replaced
+SCREEN_IMAGES = 4
+
+# Help text for each stage
+HELP_TEXT = {
+    "select": [
+        "పదార్థాలు ఎంచుకోండి - Select Ingredients",
+        "1. Click on the ingredients needed for the recipe",
+        "2. All required ingredients must be selected",
+        "3. Click 'Next' when done"
+    ],
+    "chop": [
+        "కోయండి - Chopping",
+        "1. Click on the red highlighted areas",
+        "2. You need to make 10 successful chops",
+        "3. Be quick as the active area changes"
+    ],
+    "mix": [
+        "కలపండి - Mixing",
+        "1. Click and hold inside the bowl",
+        "2. Move in a circular motion",
+        "3. Complete 15 mixing movements"
+    ],
+    "serve": [
+        "వడ్డించండి - Serving",
+        "1. Drag the food from the pot to the plate",
+        "2. You have 10 seconds to serve",
+        "3. Place food completely on the plate"
+    ]
+}
+
+
+class SessionResources:
+    """Fonts, catalog, ingredients and caches shared by every session in a process.
+
+    Everything here is read-only once loaded, so any number of sessions can
+    use one instance. Static screen layers are only cached when
+    max_layers is non-zero; each layer costs a full screen of pixels, and
+    the layer cache's byte budget bounds them at high resolutions.
+    """
+    
+    def __init__(self, max_layers=8, prefetcher=None):
+        font_registry.preload()
+        # Pre-scaled ingredient sprites, if the atlas has been built
+        asset_manager.load_atlas(os.path.join(images_dir, "atlas", "ingredients.json"))
+        # Load recipes and ingredients from the data files (via the compiled index)
+        self.catalog = load_catalog()
+        self.recipes = self.catalog.recipes
+        self.ingredients = [Ingredient(name, image_file, color, ingredient_id)
+                            for ingredient_id, name, image_file, color in self.catalog.ingredient_entries()]
+        # Grid layouts, computed once per screen size and shared by
+        # hit-testing and drawing
+        self.ingredient_grids = OrderedDict()
+        # Rendered recipe rows, shared by every session's recipe list
+        self.recipe_rows = OrderedDict()
+        # Other backgrounds are decoded on a background thread just before
+        # they are needed, instead of all staying resident
+        self.prefetcher = prefetcher or AssetPrefetcher()
+        # Static parts of each screen, rendered once per change
+        self.layers = LayerCache((SCREEN_WIDTH, SCREEN_HEIGHT), max_layers) if max_layers else None
+    
+    def grid_for(self, layout):
+        """The ingredient grid laid out for a screen size"""
+        grid = self.ingredient_grids.get(layout.size)
+        if grid is not None:
+            self.ingredient_grids.move_to_end(layout.size)
+        else:
+            cell = layout.place(*INGREDIENT_CELL)
+            spacing = (layout.scaled(INGREDIENT_SPACING[0]), layout.scaled(INGREDIENT_SPACING[1]))
+            grid = IngredientGrid(self.ingredients, cell.topleft, INGREDIENT_COLUMNS, spacing, cell.size)
+            self.ingredient_grids[layout.size] = grid
+            while len(self.ingredient_grids) > MAX_GRID_SIZES:
+                self.ingredient_grids.popitem(last=False)
+        return grid
+    
+    def fit_screen(self, size):
+        """Raise the asset cache cap if a screen's backgrounds would not fit in it.
+        
+        Otherwise at large sizes the stage backgrounds evict each other and
+        are decoded again and again. The cap is never lowered, since other
+        sessions may still be showing a larger screen.
+        """
+        needed = SCREEN_IMAGES * size[0] * size[1] * 4
+        if needed > asset_manager.max_bytes:
+            asset_manager.set_max_bytes(needed)
+    
+    def shutdown(self):
+        self.prefetcher.shutdown()
+
+
+class GameSession:
+    """One player's game: screens, stages, score and the surface it draws to.
+
+    A session never reads input or touches the display itself. Its owner
+    passes each frame's events to step_frame() and shows (or ships) the
+    regions of session.screen that present() reports as changed.
+    """
+    
+    def __init__(self, resources, screen=None, seed=None, frame_profiler=None,
+                 update_display=False, sound=True):
+        self.resources = resources
+        self.recipes = resources.recipes
+        self.ingredients = resources.ingredients
+        self.prefetcher = resources.prefetcher
+        # (stage, recipe, screen size) whose backgrounds were last requested
+        self.prefetched_stage = None
+        self.layers = resources.layers
+        # Offscreen unless the owner hands in the display surface
+        self.screen = screen if screen is not None else self.create_screen((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Only changed regions are redrawn (and pushed to the display if there is one)
+        self.renderer = DirtyRenderer(self.screen, update_display)
+        # Real frame time turned into fixed gameplay steps
+        self.game_clock = GameClock(SIMULATION_STEP)
+        # Per-phase frame timings; F3 toggles the on-screen overlay
+        self.frame_profiler = frame_profiler or NullProfiler()
+        self.sound = sound
+        self.game_state = GameState()
+        # All gameplay randomness comes from this seed so sessions can be replayed
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        
+        # Current recipe and game state
+        self.current_recipe_index = 0
+        self.current_recipe = self.recipes[self.current_recipe_index]
+        self.selected_ingredients = []
+        self.selected_ids = set()
+        self.mini_game = None
+        self.score = 0
+        
+        # Only the recipes scrolled into view are drawn or hit-tested
+        self.recipe_list = VirtualList(len(self.recipes), self.draw_recipe_row, resources.recipe_rows)
+        # Widget rects, fonts and the ingredient grid for this screen size
+        self.apply_layout()
+        self.show_help = False
+        # Regions of screen redrawn by the last present()
+        self.changed_rects = []
+        
+        # Screens and stage transitions; starts on the menu
+        self.register_states()
+    
+    def create_screen(self, size):
+        """Surface the session draws to; the windowed game returns the display"""
+        return pygame.Surface(size)
+    
+    def apply_layout(self):
+        """Compute every rect, font and grid for the current screen size"""
+        layout = self.layout = Layout(self.screen.get_size())
+        self.font = font_registry.get(TELUGU_FONT_NAMES, layout.scaled(24))
+        self.small_font = font_registry.get(TELUGU_FONT_NAMES, layout.scaled(18))
+        self.rects = layout.rects(SCREEN_WIDGETS)
+        self.start_button_rect = self.rects["start_button"]
+        self.next_button_rect = self.rects["next_button"]
+        self.help_button_rect = self.rects["help_button"]
+        self.close_help_rect = self.rects["close_help"]
+        self.recipe_list.place(self.rects["recipe_list"], layout.scaled(RECIPE_ROW_HEIGHT),
+                               layout.scaled(RECIPE_ROW_SPACING))
+        self.ingredient_grid = self.resources.grid_for(layout)
+        self.resources.fit_screen(layout.size)
+    
+    def resize(self, size):
+        """Move the session to a screen of another size.
+        
+        The layout is rebuilt once here and the scaled backgrounds and
+        sprites for the new size are queued, so no frame rescales anything.
+        """
+        if tuple(size) == self.layout.size:
+            return
+        # Images this session queued for the old size will never be drawn by
+        # it; other sessions' requests stay queued
+        self.prefetcher.cancel(self)
+        self.screen = self.create_screen(size)
+        self.renderer = DirtyRenderer(self.screen, self.renderer.update_display)
+        self.apply_layout()
+        if self.mini_game:
+            self.mini_game.place(self.layout)
+        self.prefetch_background(self.stage_background())
+        if self.game_state.current_state == "select":
+            self.prefetch_visible_ingredients()
+    
+    def play_cue(self, cue):
+        if self.sound:
+            audio.play(cue)
+    
+    def background(self, bg_name):
+        """Return a screen-sized background, finishing any prefetch of it first"""
+        bg_path = asset_manager.image_path(bg_name)
+        self.prefetcher.wait(bg_path, self.layout.size)
+        # Decoded, scaled to fit screen and converted once per size by the asset manager
+        return asset_manager.get_image(bg_path, self.layout.size,
+                                       fallback_color=BACKGROUND_COLORS.get(bg_name, DEFAULT_BACKGROUND_COLOR))
+    
+    def prefetch_background(self, bg_name):
+        self.prefetcher.request(asset_manager.image_path(bg_name), self.layout.size,
+                                fallback_color=BACKGROUND_COLORS.get(bg_name, DEFAULT_BACKGROUND_COLOR), owner=self)
+    
+    def prefetch_upcoming_assets(self):
+        """Start decoding the backgrounds of the current and next cooking stage.
+        
+        They are requested once per stage, so one the cache later evicts is
+        not queued again every frame.
+        """
+        if not self.game_state.current.cooking:
+            self.prefetched_stage = None
+            return
+        stage = (self.game_state.current_state, self.current_recipe_index, self.layout.size)
+        if stage == self.prefetched_stage:
+            return
+        self.prefetched_stage = stage
+        self.prefetch_background(self.current_recipe.background_for(self.game_state.current_state))
+        upcoming = self.game_state.next_state("done")
+        if upcoming and self.game_state.states[upcoming].cooking:
+            self.prefetch_background(self.current_recipe.background_for(upcoming))
+    
+    def stage_background(self):
+        """Background file for the screen currently shown"""
+        if self.game_state.current.cooking:
+            return self.current_recipe.background_for(self.game_state.current_state)
+        return MENU_BACKGROUND
+    
+    def prefetch_visible_ingredients(self):
+        """Start decoding only the ingredient images the select grid is about to show"""
+        for ingredient in self.ingredient_grid.visible(self.screen.get_rect()):
+            self.prefetcher.request(ingredient.image_path, self.ingredient_grid.cell_size, alpha=True,
+                                    fallback_color=ingredient.color, owner=self)
+    
+    def ingredient_image(self, ingredient, size):
+        """Return an ingredient's image, finishing any prefetch of it first"""
+        self.prefetcher.wait(ingredient.image_path, size)
+        return ingredient.load_image(size)
+    
+    def step_frame(self, events, frame_time, animating, draw=True):
+        """Run one frame of the main loop; returns False once the player quits.
+        
+        Replays call this with recorded events and frame times, so the game
+        goes through exactly the same steps as when it was recorded.
+        """
+        running = True
+        # Dragging a window edge sends many resizes per frame; only the last counts
+        new_size = None
+        self.frame_profiler.begin_frame()
+        with self.frame_profiler.section("handle_event"):
+            for event in events:
+                if event.type == pygame.VIDEORESIZE:
+                    new_size = event.size
+                elif new_size and event.type in INPUT_EVENTS:
+                    # Input after a resize is hit-tested against the new layout
+                    self.resize(new_size)
+                    new_size = None
+                if event.type == pygame.QUIT:
+                    running = False
+                # Add escape key to exit
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    # F3 toggles the frame-time overlay
+                    if event.key == pygame.K_F3:
+                        self.frame_profiler.toggle_overlay()
+                        self.renderer.invalidate()
+                # Repaint everything if the window contents were lost
+                if event.type in EXPOSE_EVENTS:
+                    self.renderer.invalidate()
+                self.handle_event(event)
+            if new_size:
+                self.resize(new_size)
+        
+        with self.frame_profiler.section("update"):
+            if animating:
+                for _ in range(self.game_clock.advance(frame_time)):
+                    self.update(self.game_clock.step)
+            else:
+                # Nothing was timed, so idle time must not pile up
+                self.game_clock.reset()
+                self.update(0.0)
+        if draw:
+            with self.frame_profiler.section("draw"):
+                self.present()
+        self.frame_profiler.end_frame()
+        return running
+    
+    def register_states(self):
+        """Register every screen and the transitions between them"""
+        states = self.game_state
+        states.add_state(State("menu", handle_event=self.menu_event, draw_static=self.draw_menu))
+        states.add_state(State("recipe_selection", handle_event=self.recipe_selection_event,
+                               draw_static=self.draw_recipe_selection, draw=self.draw_recipe_list))
+        states.add_state(State("select", enter=self.start_cooking, handle_event=self.select_event,
+                               draw_static=self.draw_select, cooking=True))
+        for name, (mini_game_class, title, next_label) in MINI_GAME_STAGES.items():
+            states.add_state(State(name, enter=partial(self.start_mini_game, mini_game_class),
+                                   exit=self.end_mini_game, handle_event=self.mini_game_event,
+                                   update=self.mini_game_update,
+                                   draw_static=partial(self.draw_cooking_header, title=title),
+                                   draw=partial(self.draw_mini_game, next_label), cooking=True))
+        
+        states.add_transition("menu", "start", "recipe_selection")
+        states.add_transition("recipe_selection", "choose", "select")
+        states.add_transition("select", "done", "chop")
+        states.add_transition("chop", "done", "mix")
+        states.add_transition("mix", "done", "serve")
+        states.add_transition("serve", "done", "recipe_selection")
+        states.set_state("menu")
+    
+    def handle_event(self, event):
+        # Handle help button click
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.help_button_rect.collidepoint(event.pos):
+                self.show_help = True
+                return
+            if self.show_help and self.close_help_rect.collidepoint(event.pos):
+                self.show_help = False
+                return
+        
+        self.game_state.handle_event(event)
+    
+    def menu_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.start_button_rect.collidepoint(event.pos):
+                self.game_state.fire("start")
+    
+    def recipe_selection_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            # Start decoding a recipe's backgrounds while it is hovered
+            index = self.recipe_list.index_at(event.pos)
+            if index is not None:
+                self.prefetch_recipe(index)
+        
+        focused = self.recipe_list.focused
+        chosen = self.recipe_list.handle_event(event)
+        if self.recipe_list.focused != focused:
+            self.prefetch_recipe(self.recipe_list.focused)
+        if chosen is not None:
+            self.current_recipe_index = chosen
+            self.current_recipe = self.recipes[chosen]
+            self.game_state.fire("choose")
+    
+    def prefetch_recipe(self, index):
+        recipe = self.recipes[index]
+        self.prefetch_background(recipe.background_for("select"))
+        self.prefetch_background(recipe.background_for("chop"))
+        # The select screen comes next; its ingredients decode while the player chooses
+        self.prefetch_visible_ingredients()
+    
+    def start_cooking(self):
+        self.selected_ingredients = []
+        self.selected_ids = set()
+        # Each recipe declares its backgrounds in the recipe data
+        self.prefetch_visible_ingredients()
+    
+    def all_ingredients_selected(self):
+        return len(self.selected_ids) == len(self.current_recipe.ingredient_ids)
+    
+    def next_clicked(self, event):
+        return event.type == pygame.MOUSEBUTTONDOWN and self.next_button_rect.collidepoint(event.pos)
+    
+    def select_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Check if an ingredient was clicked
+            ingredient = self.ingredient_grid.ingredient_at(event.pos)
+            if ingredient:
+                if ingredient.id in self.current_recipe.ingredient_ids:
+                    if ingredient.id not in self.selected_ids:
+                        self.selected_ingredients.append(ingredient)
+                        self.selected_ids.add(ingredient.id)
+                        self.play_cue("ingredient_ok")
+                else:
+                    self.play_cue("ingredient_wrong")
+            
+            # Move on once all ingredients are selected (or Next is clicked)
+            if self.all_ingredients_selected():
+                self.game_state.fire("done")
+    
+    def start_mini_game(self, mini_game_class):
+        self.mini_game = mini_game_class(rng=self.rng, layout=self.layout)
+    
+    def end_mini_game(self):
+        self.mini_game = None
+    
+    def mini_game_event(self, event):
+        if self.mini_game_call("handle_event", event) == "completed":
+            self.finish_stage()
+        elif self.next_clicked(event) and self.mini_game.is_completed():
+            self.finish_stage()
+    
+    def mini_game_update(self, dt):
+        # Mixing is measured once per frame from the buffered motion
+        if self.mini_game_call("update", dt) == "completed":
+            self.finish_stage()
+    
+    def finish_stage(self):
+        """Leave a completed mini-game stage for the next one in the transition table"""
+        # Play success sound when completed
+        self.play_cue("stage_complete")
+        self.score += STAGE_POINTS.get(self.game_state.current_state, 0)
+        self.game_state.fire("done")
+    
+    def needs_timed_updates(self):
+        """True while the active mini-game relies on a per-frame timer"""
+        return self.mini_game is not None and self.mini_game.needs_timed_updates
+    
+    def mini_game_call(self, method, *args):
+        """Call a mini-game method, timed by the frame profiler as "<Class>.<method>" """
+        with self.frame_profiler.section(f"{type(self.mini_game).__name__}.{method}"):
+            return getattr(self.mini_game, method)(*args)
+    
+    def scene_key(self):
+        """Describe the static content of the screen; it is redrawn only when this changes"""
+        return (self.game_state.current_state, self.current_recipe_index,
+                len(self.selected_ingredients), self.score, self.show_help,
+                self.mini_game is not None and self.mini_game.is_completed())
+    
+    def present(self):
+        """Draw and push only the regions that changed since the last frame.
+        
+        The changed rects are kept in changed_rects for the session's owner.
+        """
+        self.renderer.set_scene(self.scene_key())
+        if self.mini_game:
+            for rect in self.mini_game.consume_dirty_rects():
+                self.renderer.invalidate(rect)
+        for rect in self.recipe_list.consume_dirty_rects():
+            self.renderer.invalidate(rect)
+        # The overlay's numbers change every frame
+        if self.frame_profiler.show_overlay:
+            self.renderer.invalidate(self.frame_profiler.overlay_rect)
+        self.changed_rects = self.renderer.present(self.draw)
+    
+    def update(self, dt=SIMULATION_STEP):
+        """Advance the game by dt seconds; headless drivers call it once per logical frame"""
+        # Hand finished background decodes to the asset manager and queue the next ones
+        self.prefetcher.poll()
+        self.prefetch_upcoming_assets()
+        self.game_state.update(dt)
+    
+    def draw(self):
+        # Everything static on this screen comes from one cached layer; without
+        # a layer cache it is drawn directly, clipped to the changed area
+        if self.layers:
+            self.screen.blit(self.layers.get(self.layer_key(), self.draw_static_layer, size=self.layout.size), (0, 0))
+        else:
+            self.draw_static_layer(self.screen)
+        
+        # Widgets that change every frame go on top
+        self.game_state.draw()
+        
+        # Draw help overlay if shown
+        if self.show_help:
+            if self.layers:
+                help_key = ("help", self.game_state.current_state, self.layout.size)
+                self.screen.blit(self.layers.get(help_key, self.draw_help_layer, True, self.layout.size), (0, 0))
+            else:
+                self.draw_help_layer(self.screen)
+        
+        # Frame-time overlay, drawn last so it stays on top
+        if self.frame_profiler.show_overlay:
+            self.frame_profiler.draw_overlay(self.screen, font_registry.get(None, 18))
+    
+    def layer_key(self):
+        """Everything the static layer of the current screen depends on"""
+        return (self.game_state.current_state, self.current_recipe_index, self.score,
+                frozenset(self.selected_ids), self.layout.size)
+    
+    def draw_static_layer(self, surface):
+        # Force a solid color background first so we can see if the image is being drawn
+        surface.fill((150, 150, 150))  # Medium gray background
+        
+        # The menu screens use the kitchen background, cooking stages the
+        # background declared by the current recipe
+        surface.blit(self.background(self.stage_background()), (0, 0))
+        
+        self.game_state.draw_static(surface)
+        
+        # Draw help button
+        pygame.draw.rect(surface, (200, 200, 200), self.help_button_rect)
+        help_text = text_cache.render(self.small_font, "సహాయం", True, BLACK)
+        surface.blit(help_text, help_text.get_rect(center=self.help_button_rect.center))
+    
+    def draw_help_layer(self, surface):
+        # Draw semi-transparent overlay
+      #  overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+       # overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        #self.screen.blit(overlay, (0, 0))
+        
+        # Draw help panel
+        help_panel = self.rects["help_panel"]
+        pygame.draw.rect(surface, WHITE, help_panel)
+        pygame.draw.rect(surface, BLACK, help_panel, 2)
+        
+        # Draw close button
+        pygame.draw.rect(surface, (255, 0, 0), self.close_help_rect)
+        close_text = text_cache.render(self.font, "X", True, WHITE)
+        surface.blit(close_text, close_text.get_rect(center=self.close_help_rect.center))
+        
+        # Draw help text for current stage
+        help_title = text_cache.render(self.font, "సహాయం - Help", True, BLACK)
+        surface.blit(help_title, help_title.get_rect(midtop=(help_panel.centerx, help_panel.y + self.layout.scaled(20))))
+        
+        help_lines = HELP_TEXT.get(self.game_state.current_state, ["No help available for this stage"])
+        for i, line in enumerate(help_lines):
+            line_text = text_cache.render(self.small_font, line, True, BLACK)
+            surface.blit(line_text, (help_panel.x + self.layout.scaled(20),
+                                     help_panel.y + self.layout.scaled(60 + i * 30)))
+    
+    def draw_menu(self, surface):
+        # Draw title
+        title_text = text_cache.render(self.font, "తెలుగు వంటకాలు - Telugu Cooking Game", True, BLACK)
+        surface.blit(title_text, title_text.get_rect(midtop=self.rects["menu_title"].midtop))
+        
+        # Draw start button in orange
+        pygame.draw.rect(surface, ORANGE, self.start_button_rect)
+        start_text = text_cache.render(self.font, "Start", True, BLACK)
+        surface.blit(start_text, start_text.get_rect(center=self.start_button_rect.center))
+    
+    def draw_recipe_selection(self, surface):
+        # Clear any previous text by drawing a semi-transparent overlay just for the title area
+        #overlay = pygame.Surface((600, 50), pygame.SRCALPHA)
+       # overlay.fill((255, 255, 255, 200))  # Semi-transparent white
+        #self.screen.blit(overlay, (SCREEN_WIDTH // 2 - 300, 50))
+        
+        # Draw title
+        title_text = text_cache.render(self.font, "వంటకం ఎంచుకోండి - Select Recipe", True, BLACK)
+        surface.blit(title_text, title_text.get_rect(midtop=self.rects["recipe_title"].midtop))
+        
+        # Draw score
+        score_text = text_cache.render(self.font, f"స్కోరు - Score: {self.score}", True, BLACK)
+        surface.blit(score_text, score_text.get_rect(topright=self.rects["score"].topright))
+    
+    def draw_recipe_list(self):
+        # Kept out of the static layer, so scrolling only repaints the list
+        self.recipe_list.draw(self.screen)
+    
+    def draw_recipe_row(self, index, surface):
+        surface.fill(ORANGE)
+        recipe_text = text_cache.render(self.font, self.recipes[index].name, True, BLACK)
+        surface.blit(recipe_text, recipe_text.get_rect(center=surface.get_rect().center))
+    
+    def draw_cooking_header(self, surface, title):
+        # Clear any previous text for recipe name and instructions
+        #recipe_overlay = pygame.Surface((760, 80), pygame.SRCALPHA)
+        #recipe_overlay.fill((255, 255, 255, 200))  # Semi-transparent white
+        #self.screen.blit(recipe_overlay, (20, 20))
+        
+        # Draw recipe name
+        recipe_text = text_cache.render(self.font, f"వంటకం - Recipe: {self.current_recipe.name}", True, BLACK)
+        surface.blit(recipe_text, self.rects["recipe_name"])
+        
+        # Draw instructions
+        instruction_text = text_cache.render(self.small_font, self.current_recipe.instructions, True, BLACK)
+        surface.blit(instruction_text, self.rects["instructions"])
+        
+        # Draw stage title
+        stage_text = text_cache.render(self.font, title, True, BLACK)
+        surface.blit(stage_text, stage_text.get_rect(midtop=self.rects["stage_title"].midtop))
+    
+    def draw_next_button(self, surface, label):
+        pygame.draw.rect(surface, BLUE, self.next_button_rect)
+        next_text = text_cache.render(self.font, label, True, BLACK)
+        surface.blit(next_text, next_text.get_rect(center=self.next_button_rect.center))
+    
+    def draw_select(self, surface):
+        self.draw_cooking_header(surface, "పదార్థాలు ఎంచుకోండి - Select Ingredients")
+        
+        # Only cells on screen are drawn, so off-screen images are never decoded
+        cells = [(ingredient, self.ingredient_grid.rect_for(ingredient))
+                 for ingredient in self.ingredient_grid.visible(surface.get_rect())]
+        
+        # Draw the ingredient images in one batch (one atlas surface when built)
+        surface.blits([(self.ingredient_image(ingredient, rect.size), rect) for ingredient, rect in cells], False)
+        
+        for ingredient, rect in cells:
+            # Draw ingredient name
+            name_text = text_cache.render(self.small_font, ingredient.name, True, BLACK)
+            surface.blit(name_text, (rect.x, rect.y + self.layout.scaled(70)))
+            
+            # Highlight if selected
+            if ingredient.id in self.selected_ids:
+                pygame.draw.rect(surface, (0, 255, 0), rect, max(1, self.layout.scaled(3)))
+        
+        # Draw next button if all ingredients are selected
+        if self.all_ingredients_selected():
+            self.draw_next_button(surface, "తరువాత - Next")
+    
+    def draw_mini_game(self, next_label):
+        self.mini_game_call("draw", self.screen)
+        
+        # Draw next button if mini-game is completed
+        if self.mini_game.is_completed():
+            self.draw_next_button(self.screen, next_label)
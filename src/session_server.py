@@ -0,0 +1,146 @@
+"""Host many independent game sessions in one process.
+
+Each session draws to its own offscreen surface and is fed events from an
+injected source instead of the window's event queue. All sessions share
+one set of fonts, assets, text renders and recipe data, so an extra
+session only costs its own surface and game state.
+
+Example:
+    python src/session_server.py --sessions 64 --ticks 600 --bot random
+"""
+import argparse
+import os
+import time
+import tracemalloc
+from collections import deque
+
+# The dummy drivers must be selected before pygame creates a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from session import GameSession, SessionResources, SIMULATION_STEP
+
+
+class EventQueue:
+    """Events pushed from outside (a socket, a kiosk's input) for one session"""
+
+    def __init__(self):
+        self.events = deque()
+
+    def push(self, event):
+        self.events.append(event)
+
+    def drain(self, session=None):
+        """Return and remove everything pushed since the last call"""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+
+class SessionServer:
+    """Steps every hosted session once per tick.
+
+    A session's event source is any callable taking the session and
+    returning the events for this tick, such as EventQueue.drain or a
+    bot's events_for. Sessions that quit are dropped after their tick.
+    """
+
+    def __init__(self, resources=None, draw=True):
+        self.resources = resources or SessionResources(max_layers=0)
+        self.draw = draw
+        # Session -> event source
+        self.sessions = {}
+        self.ticks = 0
+
+    def add_session(self, events=None, seed=None, sound=False):
+        """Create a session fed by events; returns the session and its source"""
+        source = events or EventQueue().drain
+        session = GameSession(self.resources, seed=seed, sound=sound)
+        self.sessions[session] = source
+        return session, source
+
+    def remove_session(self, session):
+        self.sessions.pop(session, None)
+
+    def tick(self, dt=SIMULATION_STEP):
+        """Run one frame of every session; returns the sessions that quit"""
+        finished = []
+        for session, source in self.sessions.items():
+            running = session.step_frame(source(session), dt, session.needs_timed_updates(), self.draw)
+            if not running:
+                finished.append(session)
+        for session in finished:
+            self.remove_session(session)
+        self.ticks += 1
+        return finished
+
+    def shutdown(self):
+        self.sessions.clear()
+        self.resources.shutdown()
+
+
+def session_memory(server, count, events_for=None, seed=None):
+    """Add count sessions and return the average bytes each one costs.
+
+    Python objects are measured with tracemalloc; surface pixels live
+    outside the Python heap and are counted from their pitch instead.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = []
+    for i in range(count):
+        source = events_for(i) if events_for else None
+        session_seed = None if seed is None else seed + i
+        sessions.append(server.add_session(source, seed=session_seed)[0])
+    heap = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    pixels = sum(session.screen.get_pitch() * session.screen.get_height() for session in sessions)
+    return {"heap_bytes": heap / count, "surface_bytes": pixels / count}
+
+
+def main():
+    from headless import CookBot
+
+    parser = argparse.ArgumentParser(description="Run many bot-driven sessions in one process")
+    parser.add_argument("--sessions", type=int, default=32, help="number of sessions to host")
+    parser.add_argument("--ticks", type=int, default=600, help="frames to run every session for")
+    parser.add_argument("--bot", choices=["scripted", "random"], default="scripted")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the sessions and bots")
+    parser.add_argument("--layers", type=int, default=0,
+                        help="static screen layers to cache, shared by all sessions")
+    parser.add_argument("--no-draw", action="store_true", help="skip rendering entirely")
+    args = parser.parse_args()
+
+    pygame.init()
+    # Surfaces are converted to the display's pixel format, so one must exist
+    pygame.display.set_mode((1, 1))
+    server = SessionServer(SessionResources(max_layers=args.layers), draw=not args.no_draw)
+
+    def bot_for(i):
+        bot = CookBot(args.bot, None if args.seed is None else args.seed + i)
+        return bot.events_for
+
+    memory = session_memory(server, args.sessions, bot_for, args.seed)
+    sessions = list(server.sessions)
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        server.tick()
+        if not server.sessions:
+            break
+    elapsed = time.perf_counter() - start
+
+    dishes = sum(session.score for session in sessions) // 100
+    frames = server.ticks * args.sessions
+    print(f"Sessions: {args.sessions}, ticks: {server.ticks} in {elapsed:.2f}s "
+          f"({server.ticks / elapsed:.1f} ticks/s, {frames / elapsed:.0f} session frames/s)")
+    print(f"Dishes completed: {dishes}")
+    print(f"Memory per session: {memory['heap_bytes'] / 1024:.0f} KiB Python heap, "
+          f"{memory['surface_bytes'] / 1024:.0f} KiB surface")
+    server.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import json
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Times each phase of game startup"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # (name, seconds) in the order the phases ran
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def add(self, name, seconds):
+        """Record a phase timed elsewhere, e.g. work done on loader threads"""
+        self.phases.append((name, seconds))
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            "total_ms": round(1000 * self.total(), 3),
+            "phases": [{"phase": name, "ms": round(1000 * seconds, 3)} for name, seconds in self.phases],
+        }
+
+    def report(self):
+        """Print a table of phase timings"""
+        total = self.total()
+        print("Startup report")
+        for name, seconds in self.phases:
+            share = 100 * seconds / total if total else 0.0
+            print(f"  {name:<14}{1000 * seconds:>9.1f} ms {share:>5.1f}%")
+        print(f"  {'total':<14}{1000 * total:>9.1f} ms")
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
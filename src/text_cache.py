@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by a byte budget.
+
+    Shaping Telugu text is expensive, so constant strings are rendered once
+    and reused every frame. Dynamic strings such as the score produce a new
+    key only when their value changes.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Same arguments as font.render, but served from the cache when possible"""
+        # A Font object is one face at one size, so it covers both in the key
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = surface.get_pitch() * surface.get_height()
+        # Never cache a single surface larger than the whole budget
+        if size <= self.max_bytes:
+            self.entries[key] = surface
+            self.total_bytes += size
+            self.evict()
+        return surface
+
+    def evict(self):
+        """Drop least recently used surfaces until we are within budget"""
+        while self.total_bytes > self.max_bytes and self.entries:
+            _, surface = self.entries.popitem(last=False)
+            self.total_bytes -= surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+# Shared instance used by the draw loop
+text_cache = TextCache()
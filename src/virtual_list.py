@@ -0,0 +1,185 @@
+from collections import OrderedDict
+import pygame
+
+SCROLLBAR_COLOR = (120, 120, 120)
+SCROLLBAR_TRACK_COLOR = (200, 200, 200)
+FOCUS_COLOR = (0, 0, 255)
+
+
+class VirtualList:
+    """A scrollable list of fixed-height rows that only touches the rows on screen.
+
+    Row positions are arithmetic (row i starts i * stride below the top of
+    the list), so finding the visible rows or the row under the mouse costs
+    the same for five items as for five thousand. Each row is rendered once
+    by render_row(index, surface) and kept in a small LRU of row surfaces;
+    lists showing the same items can share one by passing the same rows dict.
+
+    The list is scrolled with the mouse wheel and driven from the keyboard
+    with the arrow keys, Page Up/Down, Home/End and Enter. Regions it
+    changes are reported through consume_dirty_rects(), like a mini-game's.
+    """
+
+    def __init__(self, count, render_row, rows=None, max_cached_rows=32):
+        self.count = count
+        self.render_row = render_row
+        self.max_cached_rows = max_cached_rows
+        # (index, width, height) -> rendered row
+        self.rows = rows if rows is not None else OrderedDict()
+        self.viewport = pygame.Rect(0, 0, 0, 0)
+        self.scrollbar = pygame.Rect(0, 0, 0, 0)
+        self.row_height = 1
+        self.stride = 1
+        self.scroll = 0
+        # Row with keyboard focus; None until the keyboard is used
+        self.focused = None
+        self.dirty_rects = []
+
+    def place(self, viewport, row_height, stride):
+        """Set the list's geometry; called again whenever the layout changes"""
+        # Keep the same rows in view across a resize
+        first_row = self.scroll / self.stride
+        self.viewport = pygame.Rect(viewport)
+        self.row_height = row_height
+        self.stride = stride
+        # A thin bar just right of the rows, only drawn when they overflow
+        width = max(2, stride // 12)
+        self.scrollbar = pygame.Rect(self.viewport.right + width, self.viewport.y, width, self.viewport.height)
+        self.scroll = round(first_row * stride)
+        self.clamp_scroll()
+        self.invalidate()
+
+    def content_height(self):
+        return max(0, self.count * self.stride - (self.stride - self.row_height))
+
+    def max_scroll(self):
+        return max(0, self.content_height() - self.viewport.height)
+
+    def clamp_scroll(self):
+        self.scroll = min(max(0, self.scroll), self.max_scroll())
+
+    def bounds(self):
+        """Everything the list draws on, rows and scrollbar"""
+        return self.viewport.union(self.scrollbar)
+
+    def invalidate(self):
+        bounds = self.bounds()
+        if bounds not in self.dirty_rects:
+            self.dirty_rects.append(bounds)
+
+    def consume_dirty_rects(self):
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+
+    def visible_range(self):
+        """Indices of the first and one past the last row overlapping the viewport"""
+        first = self.scroll // self.stride
+        last = (self.scroll + self.viewport.height + self.stride - 1) // self.stride
+        return first, min(self.count, last)
+
+    def row_rect(self, index):
+        """Screen rect of a row; it may lie partly or wholly outside the viewport"""
+        return pygame.Rect(self.viewport.x, self.viewport.y + index * self.stride - self.scroll,
+                           self.viewport.width, self.row_height)
+
+    def visible_rect(self, index):
+        """Rect of the row if it is entirely in view, otherwise None"""
+        rect = self.row_rect(index)
+        return rect if self.viewport.contains(rect) else None
+
+    def index_at(self, pos):
+        """Index of the row under pos, or None for the gaps and anything outside"""
+        if not self.viewport.collidepoint(pos):
+            return None
+        y = pos[1] - self.viewport.y + self.scroll
+        index = y // self.stride
+        if index >= self.count or y - index * self.stride >= self.row_height:
+            return None
+        return index
+
+    def scroll_by(self, pixels):
+        old = self.scroll
+        self.scroll += pixels
+        self.clamp_scroll()
+        if self.scroll != old:
+            self.invalidate()
+
+    def scroll_to(self, index):
+        """Scroll just far enough to bring a row fully into view"""
+        top = index * self.stride
+        if top < self.scroll:
+            self.scroll_by(top - self.scroll)
+        elif top + self.row_height > self.scroll + self.viewport.height:
+            self.scroll_by(top + self.row_height - self.viewport.height - self.scroll)
+
+    def focus(self, index):
+        index = min(max(0, index), self.count - 1)
+        if index != self.focused:
+            self.focused = index
+            self.invalidate()
+        self.scroll_to(index)
+
+    def handle_event(self, event):
+        """Scroll or move the focus; returns the index of a row the player chose, or None"""
+        if event.type == pygame.MOUSEWHEEL:
+            # Wheel up (positive y) moves towards the top of the list
+            self.scroll_by(-event.y * self.stride // 2)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            return self.index_at(event.pos)
+        elif event.type == pygame.KEYDOWN and self.count:
+            page = max(1, self.viewport.height // self.stride)
+            current = self.focused
+            if current is None:
+                # The first key press only puts the focus on the top visible row
+                current = self.visible_range()[0]
+                if event.key in (pygame.K_UP, pygame.K_DOWN):
+                    self.focus(current)
+                    return None
+            moves = {
+                pygame.K_UP: current - 1,
+                pygame.K_DOWN: current + 1,
+                pygame.K_PAGEUP: current - page,
+                pygame.K_PAGEDOWN: current + page,
+                pygame.K_HOME: 0,
+                pygame.K_END: self.count - 1,
+            }
+            if event.key in moves:
+                self.focus(moves[event.key])
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER) and self.focused is not None:
+                return self.focused
+        return None
+
+    def row_surface(self, index):
+        """The rendered row, from the cache when it was drawn recently"""
+        key = (index, self.viewport.width, self.row_height)
+        row = self.rows.get(key)
+        if row is not None:
+            self.rows.move_to_end(key)
+            return row
+        row = pygame.Surface((self.viewport.width, self.row_height))
+        if pygame.display.get_surface() is not None:
+            row = row.convert()
+        self.render_row(index, row)
+        self.rows[key] = row
+        while len(self.rows) > self.max_cached_rows:
+            self.rows.popitem(last=False)
+        return row
+
+    def clear_cache(self):
+        self.rows.clear()
+
+    def draw(self, surface):
+        first, last = self.visible_range()
+        clip = surface.get_clip()
+        surface.set_clip(self.viewport.clip(clip))
+        surface.blits([(self.row_surface(i), self.row_rect(i)) for i in range(first, last)], False)
+        if self.focused is not None and first <= self.focused < last:
+            pygame.draw.rect(surface, FOCUS_COLOR, self.row_rect(self.focused), max(2, self.stride // 30))
+        surface.set_clip(clip)
+
+        if self.max_scroll():
+            pygame.draw.rect(surface, SCROLLBAR_TRACK_COLOR, self.scrollbar)
+            height = max(self.scrollbar.width, self.scrollbar.height * self.viewport.height // self.content_height())
+            y = self.scrollbar.y + (self.scrollbar.height - height) * self.scroll // self.max_scroll()
+            pygame.draw.rect(surface, SCROLLBAR_COLOR, (self.scrollbar.x, y, self.scrollbar.width, height))